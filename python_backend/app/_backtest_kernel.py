@@ -0,0 +1,76 @@
+"""
+Backtest Kernel
+Compiled bar loop for the backtesting engine
+"""
+import numpy as np
+
+from indicators._njit import njit, HAS_NUMBA
+
+
+@njit(cache=True)
+def simulate(close, signal, initial_capital, commission):
+    """
+    Simulate a long-only, all-in position over a signal array
+
+    Args:
+        close: float64 close prices
+        signal: int8 signal codes (1 buy, -1 sell, 0 hold)
+        initial_capital: Starting cash
+        commission: Commission rate applied to traded notional
+
+    Returns:
+        Tuple of (equity, entry_idx, exit_idx, qty, pnl, capital) where equity
+        is valued before each bar's trade and capital is the final cash balance
+    """
+    n = close.shape[0]
+    equity = np.empty(n, dtype=np.float64)
+    entry_idx = np.empty(n, dtype=np.int64)
+    exit_idx = np.empty(n, dtype=np.int64)
+    qty = np.empty(n, dtype=np.int64)
+    pnl = np.empty(n, dtype=np.float64)
+
+    capital = initial_capital
+    position = 0
+    entry_price = 0.0
+    n_trades = 0
+
+    for i in range(n):
+        price = close[i]
+        equity[i] = capital + position * price
+
+        if signal[i] == 1 and position == 0:
+            shares = int(capital / price)
+            if shares > 0:
+                total_cost = shares * price + commission * shares * price
+                if total_cost <= capital:
+                    capital -= total_cost
+                    position = shares
+                    entry_price = price
+                    entry_idx[n_trades] = i
+        elif signal[i] == -1 and position > 0:
+            fee = commission * position * price
+            capital += position * price - fee
+            exit_idx[n_trades] = i
+            qty[n_trades] = position
+            pnl[n_trades] = (price - entry_price) * position - fee * 2
+            n_trades += 1
+            position = 0
+
+    # Close any open position at the end
+    if position > 0:
+        price = close[n - 1]
+        fee = commission * position * price
+        capital += position * price - fee
+        exit_idx[n_trades] = n - 1
+        qty[n_trades] = position
+        pnl[n_trades] = (price - entry_price) * position - fee * 2
+        n_trades += 1
+
+    return (
+        equity,
+        entry_idx[:n_trades],
+        exit_idx[:n_trades],
+        qty[:n_trades],
+        pnl[:n_trades],
+        capital,
+    )
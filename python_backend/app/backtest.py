@@ -2,13 +2,16 @@
 Backtesting Engine
 Simulates strategy execution on historical data and computes performance metrics
 """
-from typing import Dict, Any, List, Optional
+from dataclasses import asdict, dataclass
+from typing import Dict, Any, List, Literal
 from datetime import datetime
 import pandas as pd
 import numpy as np
 from pydantic import BaseModel
 
-from strategies.base import BaseStrategy, Signal, Trade
+from strategies.base import BaseStrategy, Trade, BUY, SELL
+from app._backtest_kernel import HAS_NUMBA, simulate
+from strategies._indicator_cache import add_indicators
 
 
 class BacktestConfig(BaseModel):
@@ -20,9 +23,11 @@ class BacktestConfig(BaseModel):
     commission: float = 0.0
     strategy_id: str
     parameters: Dict[str, Any] = {}
+    precision: Literal['f32', 'f64'] = 'f64'  # OHLCV and price array dtype; cash is always float64
 
 
-class EquityPoint(BaseModel):
+@dataclass(slots=True)
+class EquityPoint:
     """Equity curve data point"""
     timestamp: datetime
     equity: float
@@ -54,6 +59,33 @@ class BacktestResult(BaseModel):
     equity_curve: List[Dict[str, Any]]
 
 
+_OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def _downcast_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy of the DataFrame with its OHLCV columns stored as float32
+    
+    Halves the bytes read by every indicator and strategy pass over the
+    price columns; the caller's DataFrame is left untouched.
+    
+    Args:
+        df: DataFrame with OHLCV data
+    
+    Returns:
+        DataFrame with float32 open, high, low, close and volume
+    """
+    return df.astype({column: np.float32 for column in _OHLCV_COLUMNS if column in df.columns})
+
+
+# Equity curve record layout (timestamps stored as naive UTC)
+EQUITY_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[ns]'),
+    ('equity', 'f8'),
+    ('drawdown', 'f8'),
+])
+
+
 class BacktestEngine:
     """Backtesting engine for strategy evaluation"""
     
@@ -70,8 +102,20 @@ class BacktestEngine:
         self.capital = config.initial_capital
         self.position = 0  # Number of shares held
         self.trades: List[Trade] = []
-        self.equity_curve: List[EquityPoint] = []
-        self.current_trade: Optional[Trade] = None
+        self._eq = np.empty(0, dtype=EQUITY_DTYPE)
+        self._tz = None
+    
+    @property
+    def equity_curve(self) -> List[EquityPoint]:
+        """Equity curve materialized from the structured equity array"""
+        return [EquityPoint(**point) for point in self._equity_records()]
+    
+    def _equity_records(self) -> List[Dict[str, Any]]:
+        """Equity curve as plain dicts, converted in one pass over the array"""
+        equity_df = pd.DataFrame(self._eq)
+        if self._tz is not None:
+            equity_df['timestamp'] = equity_df['timestamp'].dt.tz_localize('UTC').dt.tz_convert(self._tz)
+        return equity_df.to_dict('records')
     
     def run(self, df: pd.DataFrame) -> BacktestResult:
         """
@@ -86,96 +130,185 @@ class BacktestEngine:
         if df.empty:
             raise ValueError("No data provided for backtest")
         
-        peak_equity = self.config.initial_capital
+        if self.config.precision == 'f32':
+            df = _downcast_ohlcv(df)
+        
+        # Indicators are computed once here rather than on every bar, and
+        # reused by later backtests on the same data
+        df = add_indicators(df, self.strategy.required_indicators())
+        
+        dtype = np.float32 if self.config.precision == 'f32' else np.float64
+        close = df['close'].to_numpy(dtype=dtype, copy=False)
+        timestamps = df['timestamp']
+        actions, _, _, reasons = self.strategy.analyze_batch(df)
+        signals = np.asarray(actions, dtype=np.int8)
+        self.strategy.reset()
         
         # Simulate trading
-        for i in range(len(df)):
-            bar = df.iloc[i]
-            signal = self.strategy.analyze(df, i)
-            
-            # Calculate current equity
-            current_equity = self.capital + self.position * bar['close']
-            
-            # Update drawdown
-            if current_equity > peak_equity:
-                peak_equity = current_equity
-            drawdown = (peak_equity - current_equity) / peak_equity if peak_equity > 0 else 0
-            
-            # Record equity point
-            self.equity_curve.append(EquityPoint(
-                timestamp=bar['timestamp'],
-                equity=current_equity,
-                drawdown=drawdown
-            ))
-            
-            # Execute trades based on signal
-            if signal.action == 'buy' and self.position == 0:
-                self._execute_buy(bar, signal.reason)
-            elif signal.action == 'sell' and self.position > 0:
-                self._execute_sell(bar, signal.reason)
+        if HAS_NUMBA:
+            equity, entry_idx, exit_idx, qty, pnl, capital = simulate(
+                close,
+                signals,
+                float(self.config.initial_capital),
+                float(self.config.commission)
+            )
+        else:
+            equity, entry_idx, exit_idx, qty, pnl, capital = self._simulate(close, signals)
+        
+        self.capital = capital
+        self.position = 0
+        self.trades = self._record_trades(close, signals, reasons, timestamps, entry_idx, exit_idx, qty, pnl)
+        
+        # Record equity curve
+        self._tz = timestamps.dt.tz
+        self._eq = np.empty(len(df), dtype=EQUITY_DTYPE)
+        self._eq['timestamp'] = timestamps.dt.tz_convert(None) if self._tz is not None else timestamps
+        self._eq['equity'] = equity
         
-        # Close any open position at the end
-        if self.position > 0:
-            final_bar = df.iloc[-1]
-            self._execute_sell(final_bar, "End of backtest period")
+        # Drawdown from the running equity peak
+        peak = np.maximum.accumulate(equity)
+        self._eq['drawdown'] = np.where(peak > 0, (peak - equity) / peak, 0.0)
         
         return self._generate_report()
     
-    def _execute_buy(self, bar: pd.Series, reason: str):
-        """Execute buy order"""
-        # Calculate quantity based on available capital
-        price = bar['close']
-        max_shares = int(self.capital / price)
-        
-        if max_shares > 0:
-            commission = self.config.commission * max_shares * price
-            total_cost = max_shares * price + commission
-            
-            if total_cost <= self.capital:
-                self.capital -= total_cost
-                self.position = max_shares
-                
-                # Record trade entry
-                self.current_trade = Trade(
-                    entry_time=bar['timestamp'],
-                    entry_price=price,
-                    quantity=max_shares,
-                    side='long',
-                    reason=reason
-                )
+    def _record_trades(
+        self,
+        close: np.ndarray,
+        signals: np.ndarray,
+        reasons: List[str],
+        timestamps: pd.Series,
+        entry_idx: np.ndarray,
+        exit_idx: np.ndarray,
+        qty: np.ndarray,
+        pnl: np.ndarray
+    ) -> List[Trade]:
+        """
+        Build trade records from per-trade index arrays
+        
+        Prices and timestamps are gathered for all trades at once rather than
+        looked up bar by bar.
+        
+        Args:
+            close: Close prices
+            signals: Signal codes, one per bar
+            reasons: Signal reasons, one per bar
+            timestamps: Bar timestamps
+            entry_idx: Entry bar of each trade
+            exit_idx: Exit bar of each trade
+            qty: Shares traded
+            pnl: Trade P&L net of commission
+        
+        Returns:
+            Completed trades
+        """
+        last = len(close) - 1
+        entry_prices = close[entry_idx].astype(np.float64)
+        exit_prices = close[exit_idx].astype(np.float64)
+        pnl_pct = (exit_prices - entry_prices) / entry_prices * 100
+        
+        # A position still open on the final bar is closed by the engine
+        end_of_period = (exit_idx == last) & (signals[last] != SELL)
+        
+        return [
+            Trade(
+                entry_time=entry_time,
+                entry_price=entry_price,
+                exit_time=exit_time,
+                exit_price=exit_price,
+                quantity=quantity,
+                side='long',
+                pnl=trade_pnl,
+                pnl_pct=trade_pnl_pct,
+                reason='End of backtest period' if forced else reasons[exit_]
+            )
+            for exit_, entry_time, entry_price, exit_time, exit_price, quantity, trade_pnl, trade_pnl_pct, forced in zip(
+                exit_idx.tolist(),
+                timestamps.iloc[entry_idx].tolist(),
+                entry_prices.tolist(),
+                timestamps.iloc[exit_idx].tolist(),
+                exit_prices.tolist(),
+                qty.tolist(),
+                pnl.tolist(),
+                pnl_pct.tolist(),
+                end_of_period.tolist()
+            )
+        ]
     
-    def _execute_sell(self, bar: pd.Series, reason: str):
-        """Execute sell order"""
-        if self.position > 0 and self.current_trade:
-            price = bar['close']
-            commission = self.config.commission * self.position * price
-            proceeds = self.position * price - commission
+    def _simulate(self, close: np.ndarray, signals: np.ndarray):
+        """
+        Simulate trading over a signal array without the compiled kernel
+        
+        Only bars where the position changes are visited in Python; cash and
+        share holdings are applied as deltas and expanded with a cumulative sum.
+        
+        Args:
+            close: Close prices
+            signals: Signal codes, one per bar
+        
+        Returns:
+            Tuple of (equity, entry_idx, exit_idx, qty, pnl, capital), matching
+            the compiled kernel
+        """
+        n = len(close)
+        commission_rate = self.config.commission
+        buys = np.flatnonzero(signals == BUY)
+        sells = np.flatnonzero(signals == SELL)
+        
+        # Changes take effect on the bar after the trade
+        cash_delta = np.zeros(n + 1, dtype=np.float64)
+        share_delta = np.zeros(n + 1, dtype=np.int64)
+        entries, exits, quantities, pnls = [], [], [], []
+        capital = self.config.initial_capital
+        cursor = -1
+        
+        while True:
+            k = np.searchsorted(buys, cursor, side='right')
+            if k == len(buys):
+                break
+            entry = int(buys[k])
+            entry_price = float(close[entry])
             
-            self.capital += proceeds
+            # Calculate quantity based on available capital
+            quantity = int(capital / entry_price)
+            total_cost = quantity * entry_price + commission_rate * quantity * entry_price
+            if quantity <= 0 or total_cost > capital:
+                cursor = entry
+                continue
             
-            # Complete trade record
-            pnl = (price - self.current_trade.entry_price) * self.position - (commission * 2)
-            pnl_pct = (price - self.current_trade.entry_price) / self.current_trade.entry_price * 100
+            # Exit on the next sell, or close any open position at the end
+            j = np.searchsorted(sells, entry, side='right')
+            exit_ = int(sells[j]) if j < len(sells) else n - 1
+            exit_price = float(close[exit_])
+            commission = commission_rate * quantity * exit_price
+            proceeds = quantity * exit_price - commission
             
-            completed_trade = Trade(
-                entry_time=self.current_trade.entry_time,
-                entry_price=self.current_trade.entry_price,
-                exit_time=bar['timestamp'],
-                exit_price=price,
-                quantity=self.position,
-                side='long',
-                pnl=pnl,
-                pnl_pct=pnl_pct,
-                reason=reason
-            )
+            cash_delta[entry + 1] -= total_cost
+            cash_delta[exit_ + 1] += proceeds
+            share_delta[entry + 1] += quantity
+            share_delta[exit_ + 1] -= quantity
+            capital += proceeds - total_cost
             
-            self.trades.append(completed_trade)
-            self.position = 0
-            self.current_trade = None
+            entries.append(entry)
+            exits.append(exit_)
+            quantities.append(quantity)
+            pnls.append((exit_price - entry_price) * quantity - (commission * 2))
+            cursor = exit_
+        
+        cash = self.config.initial_capital + np.cumsum(cash_delta[:n])
+        shares = np.cumsum(share_delta[:n])
+        
+        return (
+            cash + shares * close,
+            np.array(entries, dtype=np.int64),
+            np.array(exits, dtype=np.int64),
+            np.array(quantities, dtype=np.int64),
+            np.array(pnls, dtype=np.float64),
+            capital,
+        )
     
     def _generate_report(self) -> BacktestResult:
         """Generate backtest report with performance metrics"""
-        final_equity = self.capital + self.position * self.equity_curve[-1].equity if self.equity_curve else self.capital
+        final_equity = self.capital + self.position * float(self._eq['equity'][-1]) if len(self._eq) else self.capital
         
         # Calculate returns
         total_return = final_equity - self.config.initial_capital
@@ -183,44 +316,41 @@ class BacktestEngine:
         
         # Trade statistics
         total_trades = len(self.trades)
-        winning_trades = sum(1 for t in self.trades if t.pnl and t.pnl > 0)
-        losing_trades = sum(1 for t in self.trades if t.pnl and t.pnl < 0)
+        pnls = np.array([t.pnl for t in self.trades if t.pnl is not None], dtype=np.float64)
+        win_mask = pnls > 0
+        loss_mask = pnls < 0
+        winning_trades = int(win_mask.sum())
+        losing_trades = int(loss_mask.sum())
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
         
         # Average win/loss
-        wins = [t.pnl for t in self.trades if t.pnl and t.pnl > 0]
-        losses = [abs(t.pnl) for t in self.trades if t.pnl and t.pnl < 0]
-        avg_win = np.mean(wins) if wins else 0
-        avg_loss = np.mean(losses) if losses else 0
+        wins = pnls[win_mask]
+        losses = -pnls[loss_mask]
+        avg_win = wins.mean() if wins.size else 0
+        avg_loss = losses.mean() if losses.size else 0
         
         # Profit factor
-        total_wins = sum(wins) if wins else 0
-        total_losses = sum(losses) if losses else 1
+        total_wins = wins.sum()
+        total_losses = losses.sum() if losses.size else 1
         profit_factor = total_wins / total_losses if total_losses > 0 else 0
         
         # Calculate Sharpe ratio
-        if len(self.equity_curve) > 1:
-            returns = []
-            for i in range(1, len(self.equity_curve)):
-                ret = (self.equity_curve[i].equity - self.equity_curve[i-1].equity) / self.equity_curve[i-1].equity
-                returns.append(ret)
+        equity = self._eq['equity']
+        returns = np.diff(equity) / equity[:-1]
+        if returns.size > 1:
+            mean_return = returns.mean()
+            std_return = returns.std(ddof=1)
+            sharpe_ratio = (mean_return / std_return) * np.sqrt(252) if std_return > 0 else 0
             
-            if returns:
-                sharpe_ratio = (np.mean(returns) / np.std(returns)) * np.sqrt(252) if np.std(returns) > 0 else 0
-                
-                # Sortino ratio (downside deviation)
-                downside_returns = [r for r in returns if r < 0]
-                downside_std = np.std(downside_returns) if downside_returns else 0
-                sortino_ratio = (np.mean(returns) / downside_std) * np.sqrt(252) if downside_std > 0 else 0
-            else:
-                sharpe_ratio = 0
-                sortino_ratio = 0
+            # Sortino ratio (downside deviation)
+            downside_dev = np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2))
+            sortino_ratio = (mean_return / downside_dev) * np.sqrt(252) if downside_dev > 0 else 0
         else:
             sharpe_ratio = 0
             sortino_ratio = 0
         
         # Max drawdown
-        max_drawdown = max([ep.drawdown for ep in self.equity_curve]) if self.equity_curve else 0
+        max_drawdown = float(self._eq['drawdown'].max()) if len(self._eq) else 0
         max_drawdown_pct = max_drawdown * 100
         
         return BacktestResult(
@@ -243,6 +373,6 @@ class BacktestEngine:
             avg_win=avg_win,
             avg_loss=avg_loss,
             profit_factor=profit_factor,
-            trades=[t.model_dump() for t in self.trades],
-            equity_curve=[ep.model_dump() for ep in self.equity_curve]
+            trades=[asdict(t) for t in self.trades],
+            equity_curve=self._equity_records()
         )
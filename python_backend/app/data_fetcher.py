@@ -3,7 +3,12 @@ Data Fetcher
 Fetches historical market data from Alpaca API
 """
 import os
-from datetime import datetime
+import re
+import hashlib
+import tempfile
+from functools import lru_cache
+from datetime import datetime, date
+from pathlib import Path
 from typing import Optional, List
 import pandas as pd
 from alpaca.data.historical import StockHistoricalDataClient
@@ -11,16 +16,26 @@ from alpaca.data.requests import StockBarsRequest
 from alpaca.data.timeframe import TimeFrame
 
 
+# Custom timeframe format: <number><unit>
+_TF_RE = re.compile(r'(\d+)(Min|Hour|Day|Week|Month)')
+
+
 class DataFetcher:
     """Fetches historical market data"""
     
-    def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        cache_dir: Optional[str] = None
+    ):
         """
         Initialize data fetcher
         
         Args:
             api_key: Alpaca API key (defaults to env var)
             api_secret: Alpaca API secret (defaults to env var)
+            cache_dir: Directory for cached bars (default: ~/.cache/trading_platform)
         """
         self.api_key = api_key or os.getenv('ALPACA_API_KEY')
         self.api_secret = api_secret or os.getenv('ALPACA_API_SECRET')
@@ -29,6 +44,71 @@ class DataFetcher:
             raise ValueError("Alpaca API credentials not provided")
         
         self.client = StockHistoricalDataClient(self.api_key, self.api_secret)
+        
+        if cache_dir is None:
+            cache_dir = Path.home() / '.cache' / 'trading_platform'
+        
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _cache_path(self, symbol: str, start_date: str, end_date: str, timeframe: str) -> Path:
+        """
+        Get the cache file path for a bars request
+        
+        Args:
+            symbol: Stock symbol
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            timeframe: Bar timeframe
+        
+        Returns:
+            Path to the Parquet cache file
+        """
+        key = '|'.join((symbol, start_date, end_date, timeframe))
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.cache_dir / f'{digest}.parquet'
+    
+    def _read_cache(self, cache_path: Path) -> Optional[pd.DataFrame]:
+        """
+        Read cached bars, discarding a file that cannot be read
+        
+        Args:
+            cache_path: Path to the Parquet cache file
+        
+        Returns:
+            Cached DataFrame, or None on a cache miss
+        """
+        if not cache_path.exists():
+            return None
+        try:
+            # Map the file instead of reading it through a copy buffer
+            return pd.read_parquet(cache_path, engine='pyarrow', memory_map=True)
+        except Exception as e:
+            print(f"Discarding unreadable bar cache {cache_path.name}: {e}")
+            cache_path.unlink(missing_ok=True)
+            return None
+    
+    def _write_cache(self, df: pd.DataFrame, cache_path: Path):
+        """
+        Cache fetched bars atomically; a failed write only skips caching
+        
+        The file is written under a temporary name in the cache directory and
+        renamed into place, so concurrent readers never see a partial file.
+        
+        Args:
+            df: Bars to cache
+            cache_path: Path to the Parquet cache file
+        """
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.parquet.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                df.to_parquet(f, compression='zstd', index=False)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Could not cache bars in {cache_path.name}: {e}")
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
     
     def get_bars(
         self,
@@ -49,6 +129,14 @@ class DataFetcher:
         Returns:
             DataFrame with OHLCV data
         """
+        # Only ranges that have fully closed are cached; today's bars still change
+        cache_path = None
+        if datetime.fromisoformat(end_date).date() < date.today():
+            cache_path = self._cache_path(symbol, start_date, end_date, timeframe)
+            cached = self._read_cache(cache_path)
+            if cached is not None:
+                return cached
+        
         # Parse timeframe
         tf = self._parse_timeframe(timeframe)
         
@@ -70,7 +158,8 @@ class DataFetcher:
             return df
         
         # Reset index and rename columns
-        df = df.reset_index()
+        if not isinstance(df.index, pd.RangeIndex):
+            df = df.reset_index()
         
         # Rename columns to match expected format
         column_mapping = {
@@ -86,11 +175,17 @@ class DataFetcher:
         
         # Keep only relevant columns
         available_cols = [col for col in column_mapping.keys() if col in df.columns]
-        df = df[available_cols]
+        if available_cols != df.columns.tolist():
+            df = df[available_cols]
+        
+        if cache_path is not None:
+            self._write_cache(df, cache_path)
         
         return df
     
-    def _parse_timeframe(self, timeframe: str) -> TimeFrame:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _parse_timeframe(timeframe: str) -> TimeFrame:
         """
         Parse timeframe string to Alpaca TimeFrame
         
@@ -114,8 +209,7 @@ class DataFetcher:
         if not tf:
             # Try to parse custom timeframe
             # Format: <number><unit> where unit is Min, Hour, Day, Week, Month
-            import re
-            match = re.match(r'(\d+)(Min|Hour|Day|Week|Month)', timeframe)
+            match = _TF_RE.match(timeframe)
             if match:
                 amount = int(match.group(1))
                 unit_str = match.group(2)
@@ -0,0 +1,56 @@
+"""
+Parallel Backtesting
+Runs independent backtests (symbols, parameter sets) across worker processes
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from strategies import get_strategy
+from app.backtest import BacktestEngine, BacktestConfig, BacktestResult
+from app._backtest_kernel import simulate
+
+
+def _warmup():
+    """Load the compiled bar loop once per worker process"""
+    simulate(
+        np.ones(2, dtype=np.float64),
+        np.zeros(2, dtype=np.int8),
+        1.0,
+        0.0
+    )
+
+
+def _run_one(job: Tuple[BacktestConfig, pd.DataFrame]) -> BacktestResult:
+    """Run a single backtest inside a worker process"""
+    config, df = job
+    strategy = get_strategy(config.strategy_id, config.parameters)
+    return BacktestEngine(config, strategy).run(df)
+
+
+def run_parallel(
+    configs: List[BacktestConfig],
+    dfs: List[pd.DataFrame],
+    max_workers: Optional[int] = None
+) -> List[BacktestResult]:
+    """
+    Run backtests in parallel, one process per job
+
+    Args:
+        configs: Backtest configurations
+        dfs: OHLCV DataFrames, one per configuration
+        max_workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        Backtest results in the same order as configs
+    """
+    if len(configs) != len(dfs):
+        raise ValueError("Each backtest configuration needs exactly one DataFrame")
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        initializer=_warmup
+    ) as executor:
+        return list(executor.map(_run_one, zip(configs, dfs)))
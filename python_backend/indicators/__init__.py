@@ -6,9 +6,17 @@ from .technical import (
     calculate_macd,
     calculate_bollinger_bands,
     calculate_vwap,
+    calculate_session_vwap,
+    calculate_session_end,
     calculate_atr,
     calculate_stochastic,
+    calculate_trailing_mean,
+    calculate_trailing_ema,
+    calculate_opening_range,
+    opening_range_bars,
     calculate_all_indicators,
+    calculate_indicator,
+    add_indicators,
 )
 
 __all__ = [
@@ -18,7 +26,15 @@ __all__ = [
     'calculate_macd',
     'calculate_bollinger_bands',
     'calculate_vwap',
+    'calculate_session_vwap',
+    'calculate_session_end',
     'calculate_atr',
     'calculate_stochastic',
+    'calculate_trailing_mean',
+    'calculate_trailing_ema',
+    'calculate_opening_range',
+    'opening_range_bars',
     'calculate_all_indicators',
+    'calculate_indicator',
+    'add_indicators',
 ]
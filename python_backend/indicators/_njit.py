@@ -0,0 +1,16 @@
+"""
+Numba Helpers
+Optional numba JIT decorator with a pure-Python fallback
+"""
+# Try to import numba for compiled kernels
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator leaving the function as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
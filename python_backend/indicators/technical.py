@@ -4,22 +4,148 @@ Provides various technical analysis indicators for trading strategies
 """
 import pandas as pd
 import numpy as np
-from typing import Tuple
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, Tuple
+
+from ._njit import njit, HAS_NUMBA
+
+
+# pandas' numba engine parallelizes across columns, so it only pays off for
+# multi-column frames (e.g. one column per symbol); single Series stay on Cython
+_ENGINE_KW = {'engine': 'numba', 'engine_kwargs': {'parallel': True}}
+
+
+def _rolling_kwargs(data) -> dict:
+    """Engine arguments for a rolling aggregation over data"""
+    if HAS_NUMBA and data.ndim == 2 and data.shape[1] > 1:
+        return _ENGINE_KW
+    return {}
+
+
+def _rolling_std(data, period: int):
+    """Rolling sample standard deviation, numba-parallel for wide frames"""
+    rolling = data.rolling(window=period)
+    try:
+        return rolling.std(**_rolling_kwargs(data))
+    except (ImportError, NotImplementedError, TypeError):
+        return rolling.std()
+
+
+def _rolling_sum(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Trailing window sums along axis 0 via a prefix sum
+    
+    Like rolling().sum(), a window is NaN until it is full and while it holds
+    a missing value; missing values are left out of the prefix sum, so later
+    windows recover once they have passed.
+    """
+    out = np.full(values.shape, np.nan)
+    if period <= len(values):
+        missing = ~np.isfinite(values)
+        cumsum = np.cumsum(np.where(missing, 0.0, values), axis=0)
+        gaps = np.cumsum(missing, axis=0)
+        out[period - 1:] = cumsum[period - 1:]
+        out[period:] -= cumsum[:-period]
+        window_gaps = gaps[period - 1:].copy()
+        window_gaps[1:] -= gaps[:-period]
+        out[period - 1:][window_gaps > 0] = np.nan
+    return out
 
 
 def calculate_sma(data: pd.Series, period: int) -> pd.Series:
-    """Calculate Simple Moving Average"""
-    return data.rolling(window=period).mean()
+    """Calculate Simple Moving Average (per column for a DataFrame)"""
+    sma = _rolling_sum(data.to_numpy(dtype=np.float64), period) / period
+    if isinstance(data, pd.DataFrame):
+        return pd.DataFrame(sma, index=data.index, columns=data.columns)
+    return pd.Series(sma, index=data.index)
+
+
+@njit(cache=True)
+def _ema(x, alpha):
+    """
+    EMA recurrence matching pandas' ewm(adjust=False) bit for bit
+    
+    Leading NaNs stay NaN; a gap carries the last value forward and decays
+    its weight over the missing bars, as pandas does with ignore_na=False.
+    """
+    n = x.shape[0]
+    out = np.empty(n)
+    old_wt_factor = 1.0 - alpha
+    weighted = np.nan
+    old_wt = 1.0
+    for i in range(n):
+        cur = x[i]
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if cur == cur:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif cur == cur:
+            weighted = cur
+        out[i] = weighted
+    return out
 
 
 def calculate_ema(data: pd.Series, period: int) -> pd.Series:
     """Calculate Exponential Moving Average"""
-    return data.ewm(span=period, adjust=False).mean()
+    if not HAS_NUMBA or not isinstance(data, pd.Series):
+        return data.ewm(span=period, adjust=False).mean()
+    
+    ema = _ema(data.to_numpy(dtype=np.float64), 2.0 / (period + 1.0))
+    return pd.Series(ema, index=data.index, name=data.name)
+
+
+@njit(cache=True)
+def _rsi_wilder(close, period):
+    """
+    Wilder's RSI recurrence over a float64 close array
+    
+    RSI is NaN on bars whose change is missing; after a gap the averages are
+    re-seeded from the next `period` finite changes.
+    """
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    count = 0
+    
+    for i in range(1, n):
+        change = close[i] - close[i - 1]
+        if not np.isfinite(change):
+            avg_gain = 0.0
+            avg_loss = 0.0
+            count = 0
+            continue
+        
+        count += 1
+        if count <= period:
+            # Seed with the simple average of the first `period` changes
+            if change > 0:
+                avg_gain += change
+            else:
+                avg_loss -= change
+            if count < period:
+                continue
+            avg_gain /= period
+            avg_loss /= period
+        else:
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        
+        if avg_loss > 0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            rsi[i] = 100.0
+    
+    return rsi
 
 
 def calculate_rsi(data: pd.Series, period: int = 14) -> pd.Series:
     """
-    Calculate Relative Strength Index
+    Calculate Relative Strength Index using Wilder's smoothing
     
     Args:
         data: Price series
@@ -28,13 +154,13 @@ def calculate_rsi(data: pd.Series, period: int = 14) -> pd.Series:
     Returns:
         RSI values as pandas Series
     """
-    delta = data.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+    close = np.ascontiguousarray(data.to_numpy(dtype=np.float64))
+    return pd.Series(_rsi_wilder(close, period), index=data.index)
+
+
+# Compile the EMA and RSI kernels at import instead of on the first request
+_ema(np.zeros(2), 0.5)
+_rsi_wilder(np.zeros(2), 1)
 
 
 def calculate_macd(
@@ -55,13 +181,25 @@ def calculate_macd(
     Returns:
         Tuple of (macd_line, signal_line, histogram)
     """
-    fast_ema = calculate_ema(data, fast_period)
-    slow_ema = calculate_ema(data, slow_period)
-    macd_line = fast_ema - slow_ema
-    signal_line = calculate_ema(macd_line, signal_period)
-    histogram = macd_line - signal_line
+    if not HAS_NUMBA or not isinstance(data, pd.Series):
+        fast_ema = calculate_ema(data, fast_period)
+        slow_ema = calculate_ema(data, slow_period)
+        macd_line = fast_ema - slow_ema
+        signal_line = calculate_ema(macd_line, signal_period)
+        histogram = macd_line - signal_line
+        
+        return macd_line, signal_line, histogram
+    
+    # Stay on arrays until the end rather than building a Series per step
+    close = data.to_numpy(dtype=np.float64)
+    macd = _ema(close, 2.0 / (fast_period + 1.0)) - _ema(close, 2.0 / (slow_period + 1.0))
+    signal = _ema(macd, 2.0 / (signal_period + 1.0))
     
-    return macd_line, signal_line, histogram
+    return (
+        pd.Series(macd, index=data.index),
+        pd.Series(signal, index=data.index),
+        pd.Series(macd - signal, index=data.index),
+    )
 
 
 def calculate_bollinger_bands(
@@ -72,8 +210,11 @@ def calculate_bollinger_bands(
     """
     Calculate Bollinger Bands
     
+    Columns of a DataFrame are independent, so a symbol listed later or with
+    missing bars only loses the windows that overlap its gaps.
+    
     Args:
-        data: Price series
+        data: Price series, or a DataFrame with one price column per symbol
         period: Moving average period (default: 20)
         std_dev: Standard deviation multiplier (default: 2.0)
     
@@ -81,13 +222,51 @@ def calculate_bollinger_bands(
         Tuple of (upper_band, middle_band, lower_band)
     """
     middle_band = calculate_sma(data, period)
-    std = data.rolling(window=period).std()
+    std = _rolling_std(data, period)
     upper_band = middle_band + (std * std_dev)
     lower_band = middle_band - (std * std_dev)
     
     return upper_band, middle_band, lower_band
 
 
+@njit(cache=True)
+def _vwap(high, low, close, volume):
+    """
+    Cumulative VWAP in one pass, carrying the running sums as scalars
+    
+    Like pandas' cumsum, a non-finite term is left out of its running sum
+    and only that bar's VWAP is NaN.
+    """
+    n = close.shape[0]
+    out = np.empty(n)
+    num = 0.0
+    den = 0.0
+    for i in range(n):
+        pv = (high[i] + low[i] + close[i]) / 3 * volume[i]
+        pv_ok = np.isfinite(pv)
+        volume_ok = np.isfinite(volume[i])
+        if pv_ok:
+            num += pv
+        if volume_ok:
+            den += volume[i]
+        out[i] = num / den if pv_ok and volume_ok and den != 0.0 else np.nan
+    return out
+
+
+def _vwap_terms(high, low, close, volume):
+    """Price-volume and volume terms with non-finite entries zeroed, and the bars that had them"""
+    pv = (high + low + close) / 3 * volume
+    pv_ok = np.isfinite(pv)
+    volume_ok = np.isfinite(volume)
+    return np.where(pv_ok, pv, 0.0), np.where(volume_ok, volume, 0.0), pv_ok & volume_ok
+
+
+def _vwap_ratio(num, den, valid):
+    """VWAP from running sums, NaN on bars with a missing term or no volume yet"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(valid & (den != 0.0), num / den, np.nan)
+
+
 def calculate_vwap(df: pd.DataFrame) -> pd.Series:
     """
     Calculate Volume Weighted Average Price
@@ -98,9 +277,89 @@ def calculate_vwap(df: pd.DataFrame) -> pd.Series:
     Returns:
         VWAP as pandas Series
     """
-    typical_price = (df['high'] + df['low'] + df['close']) / 3
-    vwap = (typical_price * df['volume']).cumsum() / df['volume'].cumsum()
-    return vwap
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    close = df['close'].to_numpy(dtype=np.float64)
+    volume = df['volume'].to_numpy(dtype=np.float64)
+    
+    if HAS_NUMBA:
+        vwap = _vwap(high, low, close, volume)
+    else:
+        pv, volume, valid = _vwap_terms(high, low, close, volume)
+        vwap = _vwap_ratio(np.cumsum(pv), np.cumsum(volume), valid)
+    
+    return pd.Series(vwap, index=df.index)
+
+
+@njit(cache=True)
+def _session_vwap(high, low, close, volume, day):
+    """Cumulative VWAP in one pass, restarting the running sums on each new day"""
+    n = close.shape[0]
+    out = np.empty(n)
+    num = 0.0
+    den = 0.0
+    for i in range(n):
+        if i > 0 and day[i] != day[i - 1]:
+            num = 0.0
+            den = 0.0
+        pv = (high[i] + low[i] + close[i]) / 3 * volume[i]
+        pv_ok = np.isfinite(pv)
+        volume_ok = np.isfinite(volume[i])
+        if pv_ok:
+            num += pv
+        if volume_ok:
+            den += volume[i]
+        out[i] = num / den if pv_ok and volume_ok and den != 0.0 else np.nan
+    return out
+
+
+def calculate_session_vwap(df: pd.DataFrame) -> pd.Series:
+    """
+    Calculate Volume Weighted Average Price reset at the start of each day
+    
+    Args:
+        df: DataFrame with columns: timestamp, high, low, close, volume
+    
+    Returns:
+        Intraday VWAP as pandas Series
+    """
+    day = pd.DatetimeIndex(df['timestamp']).normalize().asi8
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    close = df['close'].to_numpy(dtype=np.float64)
+    volume = df['volume'].to_numpy(dtype=np.float64)
+    
+    if HAS_NUMBA:
+        vwap = _session_vwap(high, low, close, volume, day)
+    else:
+        pv, volume, valid = _vwap_terms(high, low, close, volume)
+        num = pd.Series(pv).groupby(day).cumsum().to_numpy()
+        den = pd.Series(volume).groupby(day).cumsum().to_numpy()
+        vwap = _vwap_ratio(num, den, valid)
+    
+    return pd.Series(vwap, index=df.index)
+
+
+def calculate_session_end(df: pd.DataFrame, bars: int) -> pd.Series:
+    """
+    Flag the last `bars` bars of each day
+    
+    Args:
+        df: DataFrame with a timestamp column
+        bars: Number of closing bars to flag per day
+    
+    Returns:
+        Boolean Series, True within the closing bars of the bar's day
+    """
+    day = pd.DatetimeIndex(df['timestamp']).normalize().asi8
+    n = len(day)
+    day_starts = np.flatnonzero(day[1:] != day[:-1]) + 1
+    day_ends = np.append(day_starts, n)
+    day_index = np.zeros(n, dtype=np.intp)
+    day_index[day_starts] = 1
+    np.cumsum(day_index, out=day_index)
+    bars_left = day_ends[day_index] - np.arange(n)
+    return pd.Series(bars_left <= bars, index=df.index)
 
 
 def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
@@ -114,14 +373,21 @@ def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     Returns:
         ATR as pandas Series
     """
-    high_low = df['high'] - df['low']
-    high_close = np.abs(df['high'] - df['close'].shift())
-    low_close = np.abs(df['low'] - df['close'].shift())
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    close = df['close'].to_numpy(dtype=np.float64)
+    
+    prev_close = np.empty_like(close)
+    prev_close[:1] = np.nan
+    prev_close[1:] = close[:-1]
     
-    true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    atr = true_range.rolling(window=period).mean()
+    # fmax skips missing terms like max(axis=1), including the previous close
+    # on the first bar; a bar with no true range only blanks the windows
+    # that contain it
+    true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    atr = _rolling_sum(true_range, period) / period
     
-    return atr
+    return pd.Series(atr, index=df.index)
 
 
 def calculate_stochastic(
@@ -149,16 +415,278 @@ def calculate_stochastic(
     return k_percent, d_percent
 
 
-def calculate_all_indicators(df: pd.DataFrame) -> pd.DataFrame:
+def calculate_trailing_mean(data: pd.Series, period: int) -> pd.Series:
+    """
+    Calculate the mean of up to `period` values before each bar
+    
+    The current bar is excluded and the window is shortened at the start of
+    the series, matching data.iloc[max(0, i - period):i].mean(); the first
+    bar has no history and is NaN.
+    
+    Args:
+        data: Series to average (e.g. volume)
+        period: Trailing window length
+    
+    Returns:
+        Trailing mean aligned to data's index
+    """
+    values = data.to_numpy(dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    for i in range(1, min(period, len(values))):
+        out[i] = values[:i].mean()
+    if len(values) > period:
+        out[period:] = sliding_window_view(values[:-1], period).mean(axis=1)
+    return pd.Series(out, index=data.index)
+
+
+def calculate_trailing_ema(data: pd.Series, period: int) -> pd.Series:
+    """
+    Calculate the EMA of the values before each bar
+    
+    The current bar is excluded, like calculate_trailing_mean, so the first
+    bar is NaN.
+    
+    Args:
+        data: Series to average (e.g. volume)
+        period: EMA span
+    
+    Returns:
+        Trailing EMA aligned to data's index
+    """
+    return calculate_ema(data.astype(np.float64), period).shift(1)
+
+
+def opening_range_bars(timestamps, minutes: float) -> int:
+    """
+    Count the leading bars that start within the first `minutes` of the data
+    
+    Uses a binary search over the sorted timestamps, so the count follows
+    the actual bar spacing rather than assuming one bar per minute.
+    
+    Args:
+        timestamps: Sorted bar start times
+        minutes: Length of the opening range in minutes
+    
+    Returns:
+        Number of bars in the opening range
+    """
+    times = pd.DatetimeIndex(timestamps)
+    if len(times) == 0:
+        return 0
+    return int(times.searchsorted(times[0] + pd.Timedelta(minutes=minutes), side='left'))
+
+
+def calculate_opening_range(df: pd.DataFrame, minutes: float) -> Tuple[pd.Series, pd.Series]:
+    """
+    Calculate the opening range high and low
+    
+    Within the first `minutes` of the data this is the high/low of the bars
+    so far; afterwards it holds the range of the whole opening period. NaN
+    values are skipped like pandas max/min.
+    
+    Args:
+        df: DataFrame with timestamp, high and low columns
+        minutes: Length of the opening range in minutes
+    
+    Returns:
+        Tuple of (range high, range low)
+    """
+    n = len(df)
+    head = opening_range_bars(df['timestamp'], minutes)
+    range_high = np.empty(n)
+    range_low = np.empty(n)
+    range_high[:head] = np.fmax.accumulate(df['high'].to_numpy(dtype=np.float64)[:head])
+    range_low[:head] = np.fmin.accumulate(df['low'].to_numpy(dtype=np.float64)[:head])
+    if head:
+        range_high[head:] = range_high[head - 1]
+        range_low[head:] = range_low[head - 1]
+    
+    return pd.Series(range_high, index=df.index), pd.Series(range_low, index=df.index)
+
+
+# Output columns of the fused indicator kernel, in kernel order
+_INDICATOR_COLUMNS = [
+    'sma_10', 'sma_20', 'sma_50', 'ema_12', 'ema_26', 'rsi',
+    'macd', 'macd_signal', 'macd_histogram',
+    'bb_upper', 'bb_middle', 'bb_lower', 'vwap', 'atr', 'stoch_k', 'stoch_d',
+]
+
+
+@njit(cache=True)
+def _all_indicators_kernel(high, low, close, volume):
+    """
+    Compute every default indicator in a single sweep over the bars
+    
+    Rolling means use running sums, EMAs and RSI use their recurrences, so
+    most input elements are loaded once per bar; the Bollinger variance is
+    taken in two passes over its 20-bar window, since a running sum of
+    squares drifts on long, high-priced series. Running sums are float64
+    whatever the input dtype. Inputs must be free of NaNs, which would stay
+    in the running sums.
+    
+    Returns:
+        (n, 16) array of the input dtype laid out as _INDICATOR_COLUMNS
+    """
+    n = close.shape[0]
+    out = np.full((n, 16), np.nan, close.dtype)
+    
+    alpha_12 = 2.0 / 13.0
+    alpha_26 = 2.0 / 27.0
+    alpha_9 = 2.0 / 10.0
+    
+    sum_10 = 0.0
+    sum_50 = 0.0
+    sum_tr = 0.0
+    ema_12 = float(close[0]) if n > 0 else 0.0
+    ema_26 = ema_12
+    macd_signal = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    cum_pv = 0.0
+    cum_v = 0.0
+    true_range = np.empty(n)
+    stoch_k = np.full(n, np.nan)
+    
+    for i in range(n):
+        c = float(close[i])
+        
+        # Simple moving averages and Bollinger Bands (20, 2.0)
+        sum_10 += c
+        sum_50 += c
+        if i >= 10:
+            sum_10 -= close[i - 10]
+        if i >= 50:
+            sum_50 -= close[i - 50]
+        if i >= 9:
+            out[i, 0] = sum_10 / 10.0
+        if i >= 19:
+            sum_20 = 0.0
+            for j in range(i - 19, i + 1):
+                sum_20 += close[j]
+            mean_20 = sum_20 / 20.0
+            sumsq_20 = 0.0
+            for j in range(i - 19, i + 1):
+                deviation = close[j] - mean_20
+                sumsq_20 += deviation * deviation
+            std_20 = np.sqrt(sumsq_20 / 19.0)
+            out[i, 1] = mean_20
+            out[i, 9] = mean_20 + 2.0 * std_20
+            out[i, 10] = mean_20
+            out[i, 11] = mean_20 - 2.0 * std_20
+        if i >= 49:
+            out[i, 2] = sum_50 / 50.0
+        
+        # EMAs and MACD (12/26/9)
+        if i > 0:
+            ema_12 = alpha_12 * c + (1.0 - alpha_12) * ema_12
+            ema_26 = alpha_26 * c + (1.0 - alpha_26) * ema_26
+        macd = ema_12 - ema_26
+        if i == 0:
+            macd_signal = macd
+        else:
+            macd_signal = alpha_9 * macd + (1.0 - alpha_9) * macd_signal
+        out[i, 3] = ema_12
+        out[i, 4] = ema_26
+        out[i, 6] = macd
+        out[i, 7] = macd_signal
+        out[i, 8] = macd - macd_signal
+        
+        # RSI (14, Wilder)
+        if i > 0:
+            change = c - close[i - 1]
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            if i <= 14:
+                avg_gain += gain / 14.0
+                avg_loss += loss / 14.0
+            else:
+                avg_gain = (avg_gain * 13.0 + gain) / 14.0
+                avg_loss = (avg_loss * 13.0 + loss) / 14.0
+            if i >= 14:
+                if avg_loss > 0:
+                    out[i, 5] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+                elif avg_gain > 0:
+                    out[i, 5] = 100.0
+        
+        # VWAP (cumulative)
+        cum_pv += (high[i] + low[i] + c) / 3.0 * volume[i]
+        cum_v += volume[i]
+        if cum_v != 0:
+            out[i, 12] = cum_pv / cum_v
+        
+        # ATR (14)
+        tr = high[i] - low[i]
+        if i > 0:
+            tr = max(tr, abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        true_range[i] = tr
+        sum_tr += tr
+        if i >= 14:
+            sum_tr -= true_range[i - 14]
+        if i >= 13:
+            out[i, 13] = sum_tr / 14.0
+        
+        # Stochastic (14, 3)
+        if i >= 13:
+            lowest = low[i]
+            highest = high[i]
+            for j in range(i - 13, i):
+                if low[j] < lowest:
+                    lowest = low[j]
+                if high[j] > highest:
+                    highest = high[j]
+            if highest != lowest:
+                stoch_k[i] = 100.0 * (c - lowest) / (highest - lowest)
+            out[i, 14] = stoch_k[i]
+        if i >= 15:
+            out[i, 15] = (stoch_k[i - 2] + stoch_k[i - 1] + stoch_k[i]) / 3.0
+    
+    return out
+
+
+def calculate_all_indicators(df: pd.DataFrame, dtype=np.float64) -> pd.DataFrame:
     """
     Calculate all available indicators and add them to the DataFrame
     
     Args:
         df: DataFrame with OHLCV data
+        dtype: Float dtype of the indicator columns; np.float32 halves the
+               memory traffic for large parameter sweeps (default: np.float64)
     
     Returns:
         DataFrame with all indicators added
     """
+    has_volume = 'volume' in df.columns
+    inputs = ['high', 'low', 'close', 'volume'] if has_volume else ['high', 'low', 'close']
+    
+    # The fused kernel carries running sums, so gaps go through the per-Series
+    # path, where each indicator only loses the bars its window covers
+    if not HAS_NUMBA or not np.isfinite(df[inputs].to_numpy(dtype=np.float64)).all():
+        result = _calculate_all_indicators_series(df)
+        if np.dtype(dtype) != np.float64:
+            columns = [col for col in _INDICATOR_COLUMNS if col in result.columns]
+            result[columns] = result[columns].astype(dtype)
+        return result
+    
+    out = _all_indicators_kernel(
+        df['high'].to_numpy(dtype=dtype),
+        df['low'].to_numpy(dtype=dtype),
+        df['close'].to_numpy(dtype=dtype),
+        df['volume'].to_numpy(dtype=dtype) if has_volume else np.zeros(len(df), dtype=dtype)
+    )
+    
+    columns = _INDICATOR_COLUMNS
+    if not has_volume:
+        keep = [i for i, col in enumerate(columns) if col != 'vwap']
+        out = out[:, keep]
+        columns = [columns[i] for i in keep]
+    
+    result = df.copy()
+    result[columns] = out
+    return result
+
+
+def _calculate_all_indicators_series(df: pd.DataFrame) -> pd.DataFrame:
+    """Calculate all indicators one Series at a time (used without numba)"""
     result = df.copy()
     
     # Moving averages
@@ -196,3 +724,69 @@ def calculate_all_indicators(df: pd.DataFrame) -> pd.DataFrame:
     result['stoch_d'] = d
     
     return result
+
+
+# Indicator specs accepted by add_indicators: (kind, *args) -> Series
+_INDICATOR_KINDS = {
+    'sma': lambda df, period: calculate_sma(df['close'], period),
+    'ema': lambda df, period: calculate_ema(df['close'], period),
+    'rsi': lambda df, period: calculate_rsi(df['close'], period),
+    'macd': lambda df, *args: calculate_macd(df['close'], *args)[0],
+    'macd_signal': lambda df, *args: calculate_macd(df['close'], *args)[1],
+    'macd_histogram': lambda df, *args: calculate_macd(df['close'], *args)[2],
+    'bb_upper': lambda df, *args: calculate_bollinger_bands(df['close'], *args)[0],
+    'bb_middle': lambda df, *args: calculate_bollinger_bands(df['close'], *args)[1],
+    'bb_lower': lambda df, *args: calculate_bollinger_bands(df['close'], *args)[2],
+    'vwap': lambda df: calculate_vwap(df),
+    'session_vwap': lambda df: calculate_session_vwap(df),
+    'session_end': lambda df, bars: calculate_session_end(df, bars),
+    'atr': lambda df, *args: calculate_atr(df, *args),
+    'stoch_k': lambda df, *args: calculate_stochastic(df, *args)[0],
+    'stoch_d': lambda df, *args: calculate_stochastic(df, *args)[1],
+    'volume_mean': lambda df, period: calculate_trailing_mean(df['volume'], period),
+    'volume_ema': lambda df, period: calculate_trailing_ema(df['volume'], period),
+    'opening_high': lambda df, minutes: calculate_opening_range(df, minutes)[0],
+    'opening_low': lambda df, minutes: calculate_opening_range(df, minutes)[1],
+}
+
+
+def calculate_indicator(df: pd.DataFrame, spec: Tuple) -> pd.Series:
+    """
+    Calculate a single indicator from its spec
+    
+    Args:
+        df: DataFrame with OHLCV data
+        spec: Indicator kind followed by its arguments, e.g. ('sma', 20)
+              or ('macd_signal', 12, 26, 9)
+    
+    Returns:
+        Indicator as pandas Series
+    """
+    kind, *args = spec
+    if kind not in _INDICATOR_KINDS:
+        raise ValueError(f"Unknown indicator '{kind}'")
+    return _INDICATOR_KINDS[kind](df, *args)
+
+
+def add_indicators(df: pd.DataFrame, indicators: Dict[str, Tuple]) -> pd.DataFrame:
+    """
+    Add the requested indicator columns to the DataFrame
+    
+    Columns already present are kept as they are, so a frame that has been
+    through this function once is returned unchanged.
+    
+    Args:
+        df: DataFrame with OHLCV data
+        indicators: Mapping of column name to indicator spec
+    
+    Returns:
+        DataFrame with the indicator columns added
+    """
+    missing = {name: spec for name, spec in indicators.items() if name not in df.columns}
+    if not missing:
+        return df
+    
+    result = df.copy()
+    for name, spec in missing.items():
+        result[name] = calculate_indicator(df, spec)
+    return result
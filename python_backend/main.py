@@ -3,19 +3,27 @@ FastAPI Application
 Python backend for trading platform with strategy execution and backtesting
 """
 import os
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
-from fastapi import FastAPI, HTTPException
+import asyncio
+import threading
+from functools import cache
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, List, Literal, Optional
+from datetime import datetime, timedelta, date
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic_core import to_json
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
 from dotenv import load_dotenv
 
 from strategies import get_strategy, list_strategies, STRATEGIES
 from indicators import calculate_all_indicators
-from app.backtest import BacktestEngine, BacktestConfig, BacktestResult
 from app.data_fetcher import DataFetcher
-from news_forward_tester import NewsForwardTester, NewsSignal, ForwardTestResult
 
 # Load environment variables
 load_dotenv()
@@ -24,7 +32,8 @@ load_dotenv()
 app = FastAPI(
     title="Trading Platform Python Backend",
     description="Advanced technical indicator strategies and backtesting engine",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -39,35 +48,161 @@ app.add_middleware(
 # Initialize data fetcher
 data_fetcher = DataFetcher()
 
-# Initialize news forward tester
-news_tester = NewsForwardTester()
+
+@cache
+def _news_tester():
+    """
+    News forward tester, created on first use
+    
+    Importing the tester pulls in transformers, so it waits until a news
+    endpoint is actually called. The sentiment model itself is loaded on the
+    first scoring call, so reading saved signals never loads it.
+    """
+    from news_forward_tester import NewsForwardTester
+    return NewsForwardTester()
+
+
+@cache
+def _signals_adapter() -> TypeAdapter:
+    """Adapter that dumps a whole list of news signals in one pydantic-core call"""
+    from news_forward_tester import NewsSignal
+    return TypeAdapter(List[NewsSignal])
+
+
+def _stream_backtest(result, chunk_size: int = 1000):
+    """
+    Encode a backtest result as JSON in pieces
+    
+    Metrics and trades go out first, then the equity curve in chunks of
+    chunk_size points, so the full response body is never held in memory.
+    
+    Args:
+        result: BacktestResult to encode
+        chunk_size: Equity points per chunk
+    
+    Yields:
+        Consecutive pieces of the JSON document
+    """
+    head = result.model_dump_json(exclude={'equity_curve'}).encode()
+    yield head[:-1] + b',"equity_curve":['
+    
+    curve = result.equity_curve
+    for start in range(0, len(curve), chunk_size):
+        chunk = to_json(curve[start:start + chunk_size])[1:-1]
+        yield chunk if start == 0 else b',' + chunk
+    
+    yield b']}'
+
+
+# Default-parameter strategy instances for read-only lookups; strategies
+# keep position state while running, so runs always get a fresh instance
+_DEFAULT_STRATEGIES = {strategy_id: get_strategy(strategy_id) for strategy_id in STRATEGIES}
+
+# In-process bar cache in front of the fetcher's on-disk Parquet cache
+_BARS_CACHE: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+_BARS_CACHE_SIZE = 128
+_BARS_CACHE_LOCK = threading.Lock()
+
+
+def _cached_get_bars(symbol: str, start_date: str, end_date: str, timeframe: str) -> pd.DataFrame:
+    """
+    Fetch bars, reusing frames already loaded by earlier requests
+    
+    Only closed date ranges are kept, matching the on-disk cache. Cached
+    frames are shared between requests and must not be modified in place.
+    
+    Args:
+        symbol: Stock symbol
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        timeframe: Bar timeframe
+    
+    Returns:
+        DataFrame with OHLCV data
+    """
+    key = (symbol, start_date, end_date, timeframe)
+    with _BARS_CACHE_LOCK:
+        df = _BARS_CACHE.get(key)
+        if df is not None:
+            _BARS_CACHE.move_to_end(key)
+            return df
+    
+    df = data_fetcher.get_bars(symbol, start_date, end_date, timeframe)
+    if not df.empty and datetime.fromisoformat(end_date).date() < date.today():
+        with _BARS_CACHE_LOCK:
+            _BARS_CACHE[key] = df
+            if len(_BARS_CACHE) > _BARS_CACHE_SIZE:
+                _BARS_CACHE.popitem(last=False)
+    return df
+
+
+async def _fetch_market_data(symbols: Iterable[str], start_date: str, end_date: str) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch daily bars for several symbols concurrently
+    
+    Args:
+        symbols: Stock symbols
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+    
+    Returns:
+        Dictionary of symbol -> DataFrame, skipping symbols without data
+    """
+    # Fetch each symbol once, keeping first-seen order
+    symbols = tuple(dict.fromkeys(symbols))
+    
+    results = await asyncio.gather(
+        *(run_in_threadpool(_cached_get_bars, symbol, start_date, end_date, "1Day") for symbol in symbols),
+        return_exceptions=True
+    )
+    
+    market_data = {}
+    for symbol, df in zip(symbols, results):
+        if isinstance(df, Exception):
+            print(f"Could not fetch data for {symbol}: {df}")
+        elif not df.empty:
+            market_data[symbol] = df
+    return market_data
+
+
+# Action names indexed by signal code + 1
+_ACTION_NAMES = np.array(['sell', 'hold', 'buy'])
 
 
 # Request/Response Models
+_REQUEST_CONFIG = ConfigDict(frozen=True, extra='forbid', str_strip_whitespace=True)
+
+
 class StrategyRunRequest(BaseModel):
     """Strategy execution request"""
+    model_config = _REQUEST_CONFIG
+    
     symbol: str
     strategy_id: str
     start_date: str
     end_date: str
-    parameters: Optional[Dict[str, Any]] = {}
+    parameters: Optional[Dict[str, Any]] = Field(default_factory=dict)
     timeframe: str = "1Day"
 
 
 class BacktestRequest(BaseModel):
     """Backtest request"""
+    model_config = _REQUEST_CONFIG
+    
     symbol: str
     strategy_id: str
     start_date: str
     end_date: str
     initial_capital: float = 10000.0
     commission: float = 0.0
-    parameters: Optional[Dict[str, Any]] = {}
+    parameters: Optional[Dict[str, Any]] = Field(default_factory=dict)
     timeframe: str = "1Day"
 
 
 class IndicatorsRequest(BaseModel):
     """Indicators calculation request"""
+    model_config = _REQUEST_CONFIG
+    
     symbol: str
     start_date: str
     end_date: str
@@ -76,6 +211,8 @@ class IndicatorsRequest(BaseModel):
 
 class NewsItem(BaseModel):
     """News item for sentiment analysis"""
+    model_config = _REQUEST_CONFIG
+    
     symbol: str
     headline: str
     timestamp: Optional[str] = None
@@ -83,20 +220,87 @@ class NewsItem(BaseModel):
 
 class NewsSignalsRequest(BaseModel):
     """Request for generating news-based signals"""
+    model_config = _REQUEST_CONFIG
+    
     news_items: List[NewsItem]
     symbols: Optional[List[str]] = None
     top_n: int = 5
 
 
+# Static responses, encoded once at import
+_ROOT_JSON = orjson.dumps({
+    "name": "Trading Platform Python Backend",
+    "version": "1.0.0",
+    "status": "online"
+})
+
+_INDICATORS_JSON = orjson.dumps({
+    "indicators": [
+        {
+            "id": "sma",
+            "name": "Simple Moving Average",
+            "description": "Average price over a specific period",
+            "parameters": ["period"]
+        },
+        {
+            "id": "ema",
+            "name": "Exponential Moving Average",
+            "description": "Weighted average giving more importance to recent prices",
+            "parameters": ["period"]
+        },
+        {
+            "id": "rsi",
+            "name": "Relative Strength Index",
+            "description": "Momentum oscillator measuring speed and magnitude of price changes",
+            "parameters": ["period"]
+        },
+        {
+            "id": "macd",
+            "name": "MACD",
+            "description": "Moving Average Convergence Divergence",
+            "parameters": ["fast_period", "slow_period", "signal_period"]
+        },
+        {
+            "id": "bollinger_bands",
+            "name": "Bollinger Bands",
+            "description": "Volatility bands placed above and below a moving average",
+            "parameters": ["period", "std_dev"]
+        },
+        {
+            "id": "vwap",
+            "name": "VWAP",
+            "description": "Volume Weighted Average Price",
+            "parameters": []
+        },
+        {
+            "id": "atr",
+            "name": "Average True Range",
+            "description": "Measure of market volatility",
+            "parameters": ["period"]
+        },
+        {
+            "id": "stochastic",
+            "name": "Stochastic Oscillator",
+            "description": "Momentum indicator comparing closing price to price range",
+            "parameters": ["k_period", "d_period"]
+        }
+    ]
+})
+
+
+_STRATEGY_LIST_JSON = orjson.dumps({"strategies": list_strategies()})
+
+_STRATEGY_INFO_JSON = {
+    strategy_id: orjson.dumps(strategy.get_info())
+    for strategy_id, strategy in _DEFAULT_STRATEGIES.items()
+}
+
+
 # API Routes
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "name": "Trading Platform Python Backend",
-        "version": "1.0.0",
-        "status": "online"
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 
 @app.get("/health")
@@ -112,66 +316,21 @@ async def health_check():
 @app.get("/indicators")
 async def get_indicators_list():
     """Get list of available technical indicators"""
-    return {
-        "indicators": [
-            {
-                "id": "sma",
-                "name": "Simple Moving Average",
-                "description": "Average price over a specific period",
-                "parameters": ["period"]
-            },
-            {
-                "id": "ema",
-                "name": "Exponential Moving Average",
-                "description": "Weighted average giving more importance to recent prices",
-                "parameters": ["period"]
-            },
-            {
-                "id": "rsi",
-                "name": "Relative Strength Index",
-                "description": "Momentum oscillator measuring speed and magnitude of price changes",
-                "parameters": ["period"]
-            },
-            {
-                "id": "macd",
-                "name": "MACD",
-                "description": "Moving Average Convergence Divergence",
-                "parameters": ["fast_period", "slow_period", "signal_period"]
-            },
-            {
-                "id": "bollinger_bands",
-                "name": "Bollinger Bands",
-                "description": "Volatility bands placed above and below a moving average",
-                "parameters": ["period", "std_dev"]
-            },
-            {
-                "id": "vwap",
-                "name": "VWAP",
-                "description": "Volume Weighted Average Price",
-                "parameters": []
-            },
-            {
-                "id": "atr",
-                "name": "Average True Range",
-                "description": "Measure of market volatility",
-                "parameters": ["period"]
-            },
-            {
-                "id": "stochastic",
-                "name": "Stochastic Oscillator",
-                "description": "Momentum indicator comparing closing price to price range",
-                "parameters": ["k_period", "d_period"]
-            }
-        ]
-    }
+    return Response(content=_INDICATORS_JSON, media_type="application/json")
 
 
 @app.post("/indicators/calculate")
-async def calculate_indicators(request: IndicatorsRequest):
-    """Calculate all indicators for given symbol and date range"""
+async def calculate_indicators(request: IndicatorsRequest, format: Literal['json', 'arrow'] = 'json'):
+    """
+    Calculate all indicators for given symbol and date range
+    
+    With ?format=arrow the indicator table is returned as an Arrow IPC
+    stream (read it with pyarrow.ipc.open_stream) instead of JSON records.
+    """
     try:
         # Fetch historical data
-        df = data_fetcher.get_bars(
+        df = await run_in_threadpool(
+            _cached_get_bars,
             request.symbol,
             request.start_date,
             request.end_date,
@@ -182,7 +341,17 @@ async def calculate_indicators(request: IndicatorsRequest):
             raise HTTPException(status_code=404, detail="No data available for the given period")
         
         # Calculate indicators
-        df_with_indicators = calculate_all_indicators(df)
+        df_with_indicators = await run_in_threadpool(calculate_all_indicators, df)
+        
+        if format == 'arrow':
+            table = pa.Table.from_pandas(df_with_indicators, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return Response(
+                content=sink.getvalue().to_pybytes(),
+                media_type="application/vnd.apache.arrow.stream"
+            )
         
         # Convert to JSON-serializable format
         result = df_with_indicators.to_dict(orient='records')
@@ -202,18 +371,17 @@ async def calculate_indicators(request: IndicatorsRequest):
 @app.get("/strategy/list")
 async def get_strategy_list():
     """Get list of available strategies"""
-    strategies = list_strategies()
-    return {"strategies": strategies}
+    return Response(content=_STRATEGY_LIST_JSON, media_type="application/json")
 
 
 @app.get("/strategy/{strategy_id}")
 async def get_strategy_info(strategy_id: str):
     """Get information about a specific strategy"""
-    if strategy_id not in STRATEGIES:
+    payload = _STRATEGY_INFO_JSON.get(strategy_id)
+    if payload is None:
         raise HTTPException(status_code=404, detail=f"Strategy '{strategy_id}' not found")
     
-    strategy = get_strategy(strategy_id)
-    return strategy.get_info()
+    return Response(content=payload, media_type="application/json")
 
 
 @app.post("/strategy/run")
@@ -224,7 +392,8 @@ async def run_strategy(request: StrategyRunRequest):
         strategy = get_strategy(request.strategy_id, request.parameters)
         
         # Fetch historical data
-        df = data_fetcher.get_bars(
+        df = await run_in_threadpool(
+            _cached_get_bars,
             request.symbol,
             request.start_date,
             request.end_date,
@@ -234,11 +403,29 @@ async def run_strategy(request: StrategyRunRequest):
         if df.empty:
             raise HTTPException(status_code=404, detail="No data available for the given period")
         
-        # Generate signals
-        signals = []
-        for i in range(len(df)):
-            signal = strategy.analyze(df, i)
-            signals.append(signal.model_dump())
+        # Generate signals for all bars at once
+        actions, confidences, prices, reasons = await run_in_threadpool(strategy.analyze_batch, df)
+        
+        # Counts in signal-code order: sell, hold, buy
+        sell_count, hold_count, buy_count = np.bincount(actions + 1, minlength=3).tolist()
+        
+        signals = [
+            {
+                'timestamp': timestamp,
+                'action': action,
+                'confidence': confidence,
+                'reason': reason,
+                'price': None if price != price else price,
+                'quantity': None
+            }
+            for timestamp, action, confidence, reason, price in zip(
+                df['timestamp'].tolist(),
+                _ACTION_NAMES[actions + 1].tolist(),
+                confidences.tolist(),
+                reasons,
+                prices.tolist()
+            )
+        ]
         
         return {
             "strategy_id": request.strategy_id,
@@ -247,9 +434,9 @@ async def run_strategy(request: StrategyRunRequest):
             "end_date": request.end_date,
             "signals": signals,
             "total_signals": len(signals),
-            "buy_signals": sum(1 for s in signals if s['action'] == 'buy'),
-            "sell_signals": sum(1 for s in signals if s['action'] == 'sell'),
-            "hold_signals": sum(1 for s in signals if s['action'] == 'hold')
+            "buy_signals": buy_count,
+            "sell_signals": sell_count,
+            "hold_signals": hold_count
         }
     
     except ValueError as e:
@@ -259,8 +446,10 @@ async def run_strategy(request: StrategyRunRequest):
 
 
 @app.post("/backtest/run")
-async def run_backtest(request: BacktestRequest) -> BacktestResult:
+async def run_backtest(request: BacktestRequest):
     """Run backtest and return performance metrics"""
+    from app.backtest import BacktestEngine, BacktestConfig
+    
     try:
         # Validate strategy exists
         if request.strategy_id not in STRATEGIES:
@@ -270,7 +459,8 @@ async def run_backtest(request: BacktestRequest) -> BacktestResult:
         strategy = get_strategy(request.strategy_id, request.parameters)
         
         # Fetch historical data
-        df = data_fetcher.get_bars(
+        df = await run_in_threadpool(
+            _cached_get_bars,
             request.symbol,
             request.start_date,
             request.end_date,
@@ -293,9 +483,9 @@ async def run_backtest(request: BacktestRequest) -> BacktestResult:
         
         # Run backtest
         engine = BacktestEngine(config, strategy)
-        result = engine.run(df)
+        result = await run_in_threadpool(engine.run, df)
         
-        return result
+        return StreamingResponse(_stream_backtest(result), media_type="application/json")
     
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -304,36 +494,32 @@ async def run_backtest(request: BacktestRequest) -> BacktestResult:
 
 
 @app.post("/forward/news/signals")
-async def generate_news_signals(request: NewsSignalsRequest):
+async def generate_news_signals(request: NewsSignalsRequest, background: BackgroundTasks):
     """Generate trading signals based on news sentiment"""
     try:
+        now = datetime.now()
+        
         # Convert request news items to dict format
         news_data = [item.model_dump() for item in request.news_items]
         
         # Optionally fetch market data for volume analysis
         market_data = {}
         if request.symbols:
-            end_date = datetime.now().strftime('%Y-%m-%d')
-            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            
-            for symbol in request.symbols:
-                try:
-                    df = data_fetcher.get_bars(symbol, start_date, end_date, "1Day")
-                    if not df.empty:
-                        market_data[symbol] = df
-                except Exception as e:
-                    print(f"Could not fetch data for {symbol}: {e}")
+            end_date = now.strftime('%Y-%m-%d')
+            start_date = (now - timedelta(days=30)).strftime('%Y-%m-%d')
+            market_data = await _fetch_market_data(request.symbols, start_date, end_date)
         
         # Generate signals
-        signals = news_tester.generate_signals(news_data, market_data, request.top_n)
+        tester = await run_in_threadpool(_news_tester)
+        signals = await run_in_threadpool(tester.generate_signals, news_data, market_data, request.top_n)
         
-        # Save signals
-        news_tester.save_signals(signals)
+        # Save signals once the response has been sent
+        background.add_task(tester.save_signals, signals)
         
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "total_signals": len(signals),
-            "signals": [s.model_dump() for s in signals]
+            "signals": _signals_adapter().dump_python(signals)
         }
     
     except Exception as e:
@@ -344,7 +530,8 @@ async def generate_news_signals(request: NewsSignalsRequest):
 async def get_latest_news_signals(date: Optional[str] = None):
     """Get latest news-based trading signals"""
     try:
-        signals = news_tester.load_signals(date)
+        tester = await run_in_threadpool(_news_tester)
+        signals = await run_in_threadpool(tester.load_signals, date)
         
         if signals is None:
             raise HTTPException(status_code=404, detail="No signals found for the specified date")
@@ -352,7 +539,7 @@ async def get_latest_news_signals(date: Optional[str] = None):
         return {
             "date": date or datetime.now().strftime('%Y-%m-%d'),
             "total_signals": len(signals),
-            "signals": [s.model_dump() for s in signals]
+            "signals": _signals_adapter().dump_python(signals)
         }
     
     except HTTPException:
@@ -365,7 +552,8 @@ async def get_latest_news_signals(date: Optional[str] = None):
 async def get_forward_test_results():
     """Get latest forward test results"""
     try:
-        result = news_tester.get_latest_results()
+        tester = await run_in_threadpool(_news_tester)
+        result = await run_in_threadpool(tester.get_latest_results)
         
         if result is None:
             raise HTTPException(status_code=404, detail="No forward test results found")
@@ -386,25 +574,19 @@ async def simulate_forward_test(request: NewsSignalsRequest):
         news_data = [item.model_dump() for item in request.news_items]
         
         # Fetch market data
-        market_data = {}
-        symbols = request.symbols or list(set(item.symbol for item in request.news_items))
-        
-        end_date = datetime.now().strftime('%Y-%m-%d')
-        start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+        symbols = request.symbols or [item.symbol for item in request.news_items]
         
-        for symbol in symbols:
-            try:
-                df = data_fetcher.get_bars(symbol, start_date, end_date, "1Day")
-                if not df.empty:
-                    market_data[symbol] = df
-            except Exception as e:
-                print(f"Could not fetch data for {symbol}: {e}")
+        now = datetime.now()
+        end_date = now.strftime('%Y-%m-%d')
+        start_date = (now - timedelta(days=30)).strftime('%Y-%m-%d')
+        market_data = await _fetch_market_data(symbols, start_date, end_date)
         
         # Generate signals
-        signals = news_tester.generate_signals(news_data, market_data, request.top_n)
+        tester = await run_in_threadpool(_news_tester)
+        signals = await run_in_threadpool(tester.generate_signals, news_data, market_data, request.top_n)
         
         # Simulate forward test
-        result = news_tester.simulate_forward_test(signals, market_data)
+        result = await run_in_threadpool(tester.simulate_forward_test, signals, market_data)
         
         return result.model_dump()
     
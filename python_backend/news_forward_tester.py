@@ -5,13 +5,20 @@ Selects top stocks based on news sentiment + volume
 Provides forward-looking trade signals for upcoming market sessions
 """
 import os
-import json
-from typing import Dict, Any, List, Optional
+import re
+import pickle
+import hashlib
+import threading
+from collections import OrderedDict
+from heapq import nlargest
+from operator import attrgetter
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 import pandas as pd
 import numpy as np
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic.dataclasses import dataclass
 
 # Try to import transformers for sentiment analysis
 try:
@@ -20,8 +27,259 @@ try:
 except ImportError:
     HAS_TRANSFORMERS = False
 
+# Try to import torch for TorchScript-compiled inference
+try:
+    import torch
+    HAS_TORCH = True
+except ImportError:
+    HAS_TORCH = False
+
+# Try to import ONNX Runtime support for INT8-quantized inference
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from optimum.pipelines import pipeline as ort_pipeline
+    HAS_ONNXRUNTIME = True
+except ImportError:
+    HAS_ONNXRUNTIME = False
+
+
+def _quantized_pipeline(model_name: str, cache_dir: Path):
+    """
+    Build a sentiment pipeline on a dynamically INT8-quantized ONNX model
+    
+    The model is exported and quantized on first use; later calls load the
+    quantized artifact from cache_dir.
+    
+    Args:
+        model_name: Hugging Face model id
+        cache_dir: Directory holding the quantized model
+    
+    Returns:
+        ONNX Runtime sentiment-analysis pipeline
+    """
+    quantized_file = 'model_quantized.onnx'
+    if not (cache_dir / quantized_file).exists():
+        model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+        quantizer = ORTQuantizer.from_pretrained(model)
+        quantizer.quantize(
+            save_dir=cache_dir,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=True)
+        )
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(cache_dir)
+    
+    model = ORTModelForSequenceClassification.from_pretrained(cache_dir, file_name=quantized_file)
+    tokenizer = AutoTokenizer.from_pretrained(cache_dir)
+    return ort_pipeline("sentiment-analysis", model=model, tokenizer=tokenizer, accelerator="ort")
+
+
+class _TorchScriptPipeline:
+    """Sentiment pipeline running a traced, frozen model at a fixed sequence length"""
+    
+    def __init__(self, tokenizer, model, config, max_length: int):
+        """
+        Initialize the pipeline
+        
+        Args:
+            tokenizer: Tokenizer of the traced model
+            model: Frozen TorchScript module returning logits first
+            config: Model config with the id2label mapping
+            max_length: Token length every input is padded or truncated to
+        """
+        self.tokenizer = tokenizer
+        self.model = model
+        self.config = config
+        self.max_length = max_length
+    
+    def __call__(self, texts: List[str], batch_size: int = 32, truncation: bool = True) -> List[Dict[str, Any]]:
+        """
+        Classify texts like a transformers sentiment-analysis pipeline
+        
+        Args:
+            texts: Texts to classify
+            batch_size: Texts per forward pass
+            truncation: Accepted for pipeline compatibility; inputs are always
+                truncated to the traced length
+        
+        Returns:
+            List of {'label', 'score'} predictions, one per text
+        """
+        id2label = self.config.id2label
+        results = []
+        for start in range(0, len(texts), batch_size):
+            encoded = self.tokenizer(
+                texts[start:start + batch_size],
+                return_tensors='pt',
+                padding='max_length',
+                max_length=self.max_length,
+                truncation=True
+            )
+            with torch.inference_mode():
+                logits = self.model(encoded['input_ids'], encoded['attention_mask'])[0]
+            scores, labels = logits.softmax(dim=-1).max(dim=-1)
+            results.extend(
+                {'label': id2label[label], 'score': score}
+                for label, score in zip(labels.tolist(), scores.tolist())
+            )
+        return results
+
+
+def _traced_pipeline(model_name: str, max_length: int = 128) -> _TorchScriptPipeline:
+    """
+    Build a sentiment pipeline on a TorchScript trace of the model
+    
+    Headlines fit in 128 tokens, so tracing at that fixed length lets
+    freezing fold constants and fuse operators, and calls skip the
+    transformers pipeline machinery.
+    
+    Args:
+        model_name: Hugging Face model id
+        max_length: Token length to trace at
+    
+    Returns:
+        Pipeline running the frozen traced model
+    """
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name, torchscript=True)
+    model.eval()
+    
+    example = tokenizer(
+        ["x" * 64],
+        return_tensors='pt',
+        padding='max_length',
+        max_length=max_length,
+        truncation=True
+    )
+    with torch.no_grad():
+        traced = torch.jit.trace(model, (example['input_ids'], example['attention_mask']))
+    return _TorchScriptPipeline(tokenizer, torch.jit.freeze(traced), model.config, max_length)
 
-class NewsSignal(BaseModel):
+
+# Keywords for the fallback sentiment scorer
+_POSITIVE_KEYWORDS = frozenset([
+    'gain', 'surge', 'rally', 'up', 'high', 'profit', 'growth',
+    'beat', 'outperform', 'bullish', 'upgrade', 'strong'
+])
+_NEGATIVE_KEYWORDS = frozenset([
+    'loss', 'drop', 'fall', 'down', 'low', 'miss', 'decline',
+    'weak', 'underperform', 'bearish', 'downgrade', 'cut'
+])
+
+# One-pass scan: the lookahead reports the longest keyword starting at every
+# position, and each match expands to all keywords it contains (e.g.
+# 'upgrade' also contains 'up'), matching a plain substring test per keyword
+_KEYWORD_RE = re.compile('(?=({}))'.format('|'.join(
+    re.escape(word)
+    for word in sorted(_POSITIVE_KEYWORDS | _NEGATIVE_KEYWORDS, key=len, reverse=True)
+)))
+_KEYWORD_CONTAINS = {
+    word: frozenset(other for other in _POSITIVE_KEYWORDS | _NEGATIVE_KEYWORDS if other in word)
+    for word in _POSITIVE_KEYWORDS | _NEGATIVE_KEYWORDS
+}
+
+
+# Sentiment pipeline shared by all testers, loaded on first use
+_SENTIMENT_PIPELINE = None
+_PIPELINE_LOADED = False
+_PIPELINE_LOCK = threading.Lock()
+
+
+def _load_pipeline(cache_dir: Path):
+    """
+    Load the best available sentiment pipeline
+    
+    Args:
+        cache_dir: Directory for the quantized model artifacts
+    
+    Returns:
+        Sentiment-analysis pipeline, or None if no model could be loaded
+    """
+    if not HAS_TRANSFORMERS:
+        return None
+    
+    # Use a distilled financial sentiment model, or distilbert as a fallback
+    model_name = "mrm8488/distilroberta-finetuned-financial-news-sentiment-analysis"
+    if HAS_ONNXRUNTIME:
+        try:
+            # INT8 ONNX model, exported and quantized once
+            return _quantized_pipeline(
+                model_name,
+                cache_dir / f"{model_name.replace('/', '--')}-int8"
+            )
+        except Exception as e:
+            print(f"Could not load quantized sentiment model, using full precision: {e}")
+    
+    if HAS_TORCH:
+        try:
+            # Full-precision model, traced and frozen for short headlines
+            return _traced_pipeline(model_name)
+        except Exception as e:
+            print(f"Could not trace sentiment model, using the standard pipeline: {e}")
+    
+    try:
+        return pipeline(
+            "sentiment-analysis",
+            model=model_name,
+            tokenizer=model_name
+        )
+    except Exception as e:
+        print(f"Could not load financial sentiment model, using fallback: {e}")
+    
+    try:
+        # Fallback to distilbert
+        return pipeline(
+            "sentiment-analysis",
+            model="distilbert-base-uncased-finetuned-sst-2-english"
+        )
+    except Exception:
+        print("Could not load sentiment model")
+    return None
+
+
+def _get_pipeline(cache_dir: Path):
+    """
+    Get the shared sentiment pipeline, loading it on the first call
+    
+    Args:
+        cache_dir: Directory for the quantized model artifacts
+    
+    Returns:
+        Sentiment-analysis pipeline, or None if no model is available
+    """
+    global _SENTIMENT_PIPELINE, _PIPELINE_LOADED
+    if not _PIPELINE_LOADED:
+        with _PIPELINE_LOCK:
+            if not _PIPELINE_LOADED:
+                _SENTIMENT_PIPELINE = _load_pipeline(cache_dir)
+                _PIPELINE_LOADED = True
+    return _SENTIMENT_PIPELINE
+
+
+# Saved JSON is compact unless pretty output is requested for debugging
+_JSON_INDENT = 2 if os.getenv('NEWS_PRETTY_JSON', '').lower() in ('1', 'true', 'yes') else None
+
+
+# Model scores kept per headline, keyed by (model id, hash of the scored text)
+_SENTIMENT_CACHE_SIZE = 50_000
+_SENTIMENT_CACHE_FILE = 'sentiment_cache.pkl'
+
+
+def _text_hash(text: str) -> int:
+    """Stable 64-bit hash of the part of a headline that is scored"""
+    return int.from_bytes(
+        hashlib.blake2b(text[:512].encode(), digest_size=8).digest(),
+        'little'
+    )
+
+
+def _pipeline_id(pipe) -> str:
+    """Identify the model behind a pipeline so cached scores never cross models"""
+    config = getattr(pipe, 'config', None) or getattr(getattr(pipe, 'model', None), 'config', None)
+    return getattr(config, '_name_or_path', None) or type(pipe).__name__
+
+
+@dataclass(slots=True, kw_only=True)
+class NewsSignal:
     """News-based trading signal"""
     symbol: str
     timestamp: datetime
@@ -34,6 +292,17 @@ class NewsSignal(BaseModel):
     reason: str
 
 
+class SignalsFile(BaseModel):
+    """Saved signals file"""
+    date: str
+    timestamp: str
+    signals: List[NewsSignal]
+
+
+# Converts signal lists to plain dicts for forward-test results
+_SIGNALS_ADAPTER = TypeAdapter(List[NewsSignal])
+
+
 class ForwardTestResult(BaseModel):
     """Forward test result"""
     signal_date: str
@@ -48,12 +317,15 @@ class ForwardTestResult(BaseModel):
 class NewsForwardTester:
     """News-based forward tester for predicting upcoming trades"""
     
-    def __init__(self, results_dir: Optional[str] = None):
+    __slots__ = ('results_dir', '_pipeline_override', '_sentiment_cache', '_cache_lock')
+    
+    def __init__(self, results_dir: Optional[str] = None, sentiment_analyzer: Optional[Any] = None):
         """
         Initialize news forward tester
         
         Args:
             results_dir: Directory to store results (default: backend/results/news_signals)
+            sentiment_analyzer: Optional sentiment pipeline to use instead of the shared model
         """
         if results_dir is None:
             backend_dir = Path(__file__).parent
@@ -62,27 +334,19 @@ class NewsForwardTester:
         self.results_dir = Path(results_dir)
         self.results_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize sentiment model if available
-        self.sentiment_analyzer = None
-        if HAS_TRANSFORMERS:
-            try:
-                # Use FinBERT or distilbert for financial sentiment
-                model_name = "ProsusAI/finbert"
-                self.sentiment_analyzer = pipeline(
-                    "sentiment-analysis",
-                    model=model_name,
-                    tokenizer=model_name
-                )
-            except Exception as e:
-                print(f"Could not load FinBERT model, using fallback: {e}")
-                try:
-                    # Fallback to distilbert
-                    self.sentiment_analyzer = pipeline(
-                        "sentiment-analysis",
-                        model="distilbert-base-uncased-finetuned-sst-2-english"
-                    )
-                except Exception:
-                    print("Could not load sentiment model")
+        # Explicit sentiment pipeline; the shared model is loaded on first use otherwise
+        self._pipeline_override = sentiment_analyzer
+        
+        # Model scores from earlier runs
+        self._sentiment_cache = self._load_sentiment_cache()
+        self._cache_lock = threading.Lock()
+    
+    @property
+    def sentiment_analyzer(self):
+        """Sentiment pipeline, or None if no model is available"""
+        if self._pipeline_override is not None:
+            return self._pipeline_override
+        return _get_pipeline(self.results_dir)
     
     def analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """
@@ -94,33 +358,120 @@ class NewsForwardTester:
         Returns:
             Dictionary with sentiment score and label
         """
-        if self.sentiment_analyzer is None:
+        return self.analyze_sentiments_batch([text])[0]
+    
+    def analyze_sentiments_batch(self, texts: List[str], batch_size: int = 32) -> List[Dict[str, Any]]:
+        """
+        Analyze sentiment of many texts with one model call
+        
+        Args:
+            texts: Texts to analyze
+            batch_size: Texts per forward pass
+        
+        Returns:
+            List of dictionaries with sentiment score and label, one per text
+        """
+        if not texts:
+            return []
+        
+        pipe = self.sentiment_analyzer
+        if pipe is None:
             # Fallback to simple keyword-based sentiment
-            return self._fallback_sentiment(text)
+            return [self._fallback_sentiment(text) for text in texts]
+        
+        # Score only headlines that are not cached, each distinct one once
+        model_id = _pipeline_id(pipe)
+        keys = [(model_id, _text_hash(text)) for text in texts]
+        known: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        missing: Dict[Tuple[str, int], str] = {}
+        with self._cache_lock:
+            cache = self._sentiment_cache
+            for key, text in zip(keys, texts):
+                if key in cache:
+                    known[key] = cache[key]
+                    cache.move_to_end(key)
+                else:
+                    missing[key] = text
         
-        try:
-            result = self.sentiment_analyzer(text[:512])[0]  # Limit to 512 chars
-            
-            # Map labels to scores
-            label = result['label'].lower()
-            score = result['score']
-            
-            # Convert to -1 to 1 scale
-            if 'positive' in label or label == 'label_2':
-                sentiment_score = score
-            elif 'negative' in label or label == 'label_0':
-                sentiment_score = -score
-            else:
-                sentiment_score = 0
+        if missing:
+            try:
+                results = pipe(
+                    [text[:512] for text in missing.values()],  # Limit to 512 chars
+                    batch_size=batch_size,
+                    truncation=True
+                )
+            except Exception as e:
+                print(f"Sentiment analysis error: {e}")
+                return [self._fallback_sentiment(text) for text in texts]
             
-            return {
-                'score': sentiment_score,
-                'label': 'positive' if sentiment_score > 0 else 'negative' if sentiment_score < 0 else 'neutral',
-                'confidence': abs(score)
-            }
+            scored = {key: self._model_sentiment(result) for key, result in zip(missing, results)}
+            known.update(scored)
+            with self._cache_lock:
+                cache.update(scored)
+                while len(cache) > _SENTIMENT_CACHE_SIZE:
+                    cache.popitem(last=False)
+        
+        return [dict(known[key]) for key in keys]
+    
+    def _load_sentiment_cache(self) -> "OrderedDict[Tuple[str, int], Dict[str, Any]]":
+        """
+        Load model scores saved by an earlier run
+        
+        Returns:
+            Cached scores, oldest first (empty if none were saved)
+        """
+        filepath = self.results_dir / _SENTIMENT_CACHE_FILE
+        if not filepath.exists():
+            return OrderedDict()
+        
+        try:
+            with open(filepath, 'rb') as f:
+                return OrderedDict(pickle.load(f))
         except Exception as e:
-            print(f"Sentiment analysis error: {e}")
-            return self._fallback_sentiment(text)
+            print(f"Could not load sentiment cache: {e}")
+            return OrderedDict()
+    
+    def _save_sentiment_cache(self):
+        """Persist the cached model scores for later runs"""
+        if not self._sentiment_cache:
+            return
+        
+        with self._cache_lock:
+            entries = list(self._sentiment_cache.items())
+        
+        with open(self.results_dir / _SENTIMENT_CACHE_FILE, 'wb') as f:
+            pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @staticmethod
+    def _model_sentiment(result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a sentiment pipeline prediction to a score and label
+        
+        Args:
+            result: Pipeline output with 'label' and 'score'
+        
+        Returns:
+            Dictionary with sentiment score and label
+        """
+        # Map labels to scores
+        label = result['label'].lower()
+        score = result['score']
+        
+        # Convert to -1 to 1 scale
+        if label == 'neutral':
+            sentiment_score = 0
+        elif 'positive' in label or label == 'label_2':
+            sentiment_score = score
+        elif 'negative' in label or label == 'label_0':
+            sentiment_score = -score
+        else:
+            sentiment_score = 0
+        
+        return {
+            'score': sentiment_score,
+            'label': 'positive' if sentiment_score > 0 else 'negative' if sentiment_score < 0 else 'neutral',
+            'confidence': abs(score)
+        }
     
     def _fallback_sentiment(self, text: str) -> Dict[str, Any]:
         """
@@ -132,19 +483,13 @@ class NewsForwardTester:
         Returns:
             Dictionary with sentiment score and label
         """
-        text_lower = text.lower()
-        
-        positive_keywords = [
-            'gain', 'surge', 'rally', 'up', 'high', 'profit', 'growth',
-            'beat', 'outperform', 'bullish', 'upgrade', 'strong'
-        ]
-        negative_keywords = [
-            'loss', 'drop', 'fall', 'down', 'low', 'miss', 'decline',
-            'weak', 'underperform', 'bearish', 'downgrade', 'cut'
-        ]
+        # Keywords found anywhere in the text, each counted once
+        found = set()
+        for match in _KEYWORD_RE.findall(text.lower()):
+            found |= _KEYWORD_CONTAINS[match]
         
-        positive_count = sum(1 for word in positive_keywords if word in text_lower)
-        negative_count = sum(1 for word in negative_keywords if word in text_lower)
+        positive_count = len(found & _POSITIVE_KEYWORDS)
+        negative_count = len(found & _NEGATIVE_KEYWORDS)
         
         total = positive_count + negative_count
         if total == 0:
@@ -175,67 +520,71 @@ class NewsForwardTester:
         Returns:
             List of news-based trading signals
         """
-        # Aggregate news by symbol
-        symbol_news: Dict[str, List[Dict]] = {}
-        for item in news_data:
-            symbol = item.get('symbol')
-            if symbol:
-                if symbol not in symbol_news:
-                    symbol_news[symbol] = []
-                symbol_news[symbol].append(item)
-        
-        # Score each symbol
-        signals = []
-        for symbol, news_items in symbol_news.items():
-            # Analyze sentiment for all news
-            sentiments = []
-            for item in news_items:
-                headline = item.get('headline', '')
-                sentiment = self.analyze_sentiment(headline)
-                sentiments.append(sentiment)
-            
-            # Aggregate sentiment
-            avg_score = np.mean([s['score'] for s in sentiments])
-            avg_confidence = np.mean([s['confidence'] for s in sentiments])
-            
-            # Calculate volume score if market data available
-            volume_score = 1.0
-            if market_data and symbol in market_data:
-                df = market_data[symbol]
-                if 'volume' in df.columns and len(df) > 20:
-                    recent_volume = df['volume'].iloc[-5:].mean()
-                    avg_volume = df['volume'].iloc[-20:].mean()
-                    volume_score = recent_volume / avg_volume if avg_volume > 0 else 1.0
-            
-            # Determine action
-            if avg_score > 0.3 and volume_score > 1.2:
-                action = 'buy'
-                confidence = min((abs(avg_score) + volume_score - 1) / 2, 1.0)
-            elif avg_score < -0.3:
-                action = 'sell'
-                confidence = min(abs(avg_score) * avg_confidence, 1.0)
-            else:
-                action = 'hold'
-                confidence = 0.5
-            
-            sentiment_label = 'positive' if avg_score > 0.2 else 'negative' if avg_score < -0.2 else 'neutral'
-            
-            signal = NewsSignal(
-                symbol=symbol,
-                timestamp=datetime.now(),
-                sentiment_score=avg_score,
-                sentiment_label=sentiment_label,
-                news_count=len(news_items),
-                volume_score=volume_score,
-                action=action,
-                confidence=confidence,
-                reason=f'{len(news_items)} news items, avg sentiment={avg_score:.2f}, vol_ratio={volume_score:.2f}x'
+        # One row per headline, in feed order
+        news_df = pd.DataFrame(
+            [(item['symbol'], item.get('headline', '')) for item in news_data if item.get('symbol')],
+            columns=['symbol', 'headline']
+        )
+        if news_df.empty:
+            return []
+        
+        # Analyze sentiment for all news in one batch
+        sentiments = self.analyze_sentiments_batch(news_df['headline'].tolist())
+        news_df['score'] = [s['score'] for s in sentiments]
+        news_df['confidence'] = [s['confidence'] for s in sentiments]
+        
+        # Aggregate sentiment per symbol
+        agg = news_df.groupby('symbol', sort=False).agg(
+            score=('score', 'mean'),
+            conf=('confidence', 'mean'),
+            n=('symbol', 'size')
+        )
+        
+        # Calculate volume score if market data available
+        volume_stats = {
+            symbol: (df['volume'].to_numpy()[-5:].mean(), df['volume'].to_numpy()[-20:].mean())
+            for symbol, df in (market_data or {}).items()
+            if symbol in agg.index and 'volume' in df.columns and len(df) > 20
+        }
+        agg['volume_score'] = [
+            recent / avg if avg > 0 else 1.0
+            for recent, avg in (volume_stats.get(symbol, (1.0, 1.0)) for symbol in agg.index)
+        ]
+        
+        # Determine action
+        avg_score = agg['score'].to_numpy()
+        volume_score = agg['volume_score'].to_numpy()
+        buy = (avg_score > 0.3) & (volume_score > 1.2)
+        sell = ~buy & (avg_score < -0.3)
+        agg['action'] = np.select([buy, sell], ['buy', 'sell'], 'hold')
+        agg['confidence'] = np.select(
+            [buy, sell],
+            [
+                np.minimum((np.abs(avg_score) + volume_score - 1) / 2, 1.0),
+                np.minimum(np.abs(avg_score) * agg['conf'].to_numpy(), 1.0)
+            ],
+            0.5
+        )
+        agg['label'] = np.select([avg_score > 0.2, avg_score < -0.2], ['positive', 'negative'], 'neutral')
+        
+        now = datetime.now()
+        signals = [
+            NewsSignal(
+                symbol=row.Index,
+                timestamp=now,
+                sentiment_score=row.score,
+                sentiment_label=row.label,
+                news_count=row.n,
+                volume_score=row.volume_score,
+                action=row.action,
+                confidence=row.confidence,
+                reason=f'{row.n} news items, avg sentiment={row.score:.2f}, vol_ratio={row.volume_score:.2f}x'
             )
-            signals.append(signal)
+            for row in agg.itertuples()
+        ]
         
-        # Sort by confidence and return top N
-        signals.sort(key=lambda x: x.confidence, reverse=True)
-        return signals[:top_n * 2]  # Return top positive and negative
+        # Return top N positive and negative by confidence
+        return nlargest(top_n * 2, signals, key=attrgetter('confidence'))
     
     def save_signals(self, signals: List[NewsSignal], date: Optional[str] = None):
         """
@@ -250,14 +599,15 @@ class NewsForwardTester:
         
         filepath = self.results_dir / f'signals_{date}.json'
         
-        data = {
-            'date': date,
-            'timestamp': datetime.now().isoformat(),
-            'signals': [s.model_dump() for s in signals]
-        }
+        data = SignalsFile(
+            date=date,
+            timestamp=datetime.now().isoformat(),
+            signals=signals
+        )
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        filepath.write_text(data.model_dump_json(indent=_JSON_INDENT))
+        
+        self._save_sentiment_cache()
         
         print(f"Signals saved to {filepath}")
     
@@ -279,11 +629,7 @@ class NewsForwardTester:
         if not filepath.exists():
             return None
         
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        
-        signals = [NewsSignal(**s) for s in data['signals']]
-        return signals
+        return SignalsFile.model_validate_json(filepath.read_bytes()).signals
     
     def simulate_forward_test(
         self,
@@ -306,7 +652,11 @@ class NewsForwardTester:
         total_return = 0.0
         winning_trades = 0
         
-        for signal in signals:
+        # Draw every simulated price change up front
+        rng = np.random.default_rng()
+        shocks = rng.normal(0.01, 0.02, size=len(signals))
+        
+        for i, signal in enumerate(signals):
             if signal.action in ['buy', 'sell'] and signal.symbol in market_data:
                 df = market_data[signal.symbol]
                 
@@ -314,11 +664,11 @@ class NewsForwardTester:
                     continue
                 
                 # Simulate entry at next open
-                entry_price = df.iloc[-1]['close']  # Use last close as proxy
+                entry_price = float(df['close'].iloc[-1])  # Use last close as proxy
                 
                 # Simulate exit after one day (simplified)
                 # In production, you'd track across multiple days
-                exit_price = entry_price * (1 + np.random.normal(0.01, 0.02))  # Simulated price change
+                exit_price = entry_price * (1 + shocks[i])  # Simulated price change
                 
                 if signal.action == 'buy':
                     pnl = (exit_price - entry_price) / entry_price
@@ -332,13 +682,13 @@ class NewsForwardTester:
                     winning_trades += 1
                 
                 simulated_trades.append({
+                    'signal_id': i,  # Index into the result's signals
                     'symbol': signal.symbol,
                     'action': signal.action,
                     'entry_price': entry_price,
                     'exit_price': exit_price,
                     'pnl': pnl,
-                    'pnl_dollars': pnl_dollars,
-                    'sentiment_score': signal.sentiment_score
+                    'pnl_dollars': pnl_dollars
                 })
         
         signal_date = datetime.now().strftime('%Y-%m-%d')
@@ -347,7 +697,7 @@ class NewsForwardTester:
         result = ForwardTestResult(
             signal_date=signal_date,
             trade_date=trade_date,
-            signals=[s.model_dump() for s in signals],
+            signals=_SIGNALS_ADAPTER.dump_python(signals),
             simulated_trades=simulated_trades,
             cumulative_return=total_return,
             total_trades=len(simulated_trades),
@@ -356,8 +706,7 @@ class NewsForwardTester:
         
         # Save result
         result_file = self.results_dir / f'forward_test_{signal_date}.json'
-        with open(result_file, 'w') as f:
-            json.dump(result.model_dump(), f, indent=2, default=str)
+        result_file.write_text(result.model_dump_json(indent=_JSON_INDENT))
         
         return result
     
@@ -368,12 +717,10 @@ class NewsForwardTester:
         Returns:
             Latest forward test result or None
         """
-        result_files = sorted(self.results_dir.glob('forward_test_*.json'), reverse=True)
+        # Most recently written result in one pass over the directory
+        latest = max(self.results_dir.glob('forward_test_*.json'), key=os.path.getmtime, default=None)
         
-        if not result_files:
+        if latest is None:
             return None
         
-        with open(result_files[0], 'r') as f:
-            data = json.load(f)
-        
-        return ForwardTestResult(**data)
+        return ForwardTestResult.model_validate_json(latest.read_bytes())
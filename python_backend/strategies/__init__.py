@@ -1,4 +1,6 @@
 """Strategies module"""
+import copy
+
 from .base import BaseStrategy, Signal, Trade
 from .sma_crossover import SMACrossoverStrategy
 from .rsi_mean_revert import RSIMeanReversionStrategy
@@ -43,6 +45,24 @@ def get_strategy(strategy_id: str, parameters: dict = None) -> BaseStrategy:
     return strategy_class(parameters or {})
 
 
+def _strategy_meta(strategy_id: str, strategy_class: type) -> dict:
+    """Describe a strategy with its default parameters"""
+    instance = strategy_class()
+    return {
+        'id': strategy_id,
+        'name': instance.name,
+        'description': instance.description,
+        'parameters': instance.parameters,
+    }
+
+
+# Strategy metadata, built once instead of instantiating on every listing
+_STRATEGY_META = {
+    strategy_id: _strategy_meta(strategy_id, strategy_class)
+    for strategy_id, strategy_class in STRATEGIES.items()
+}
+
+
 def list_strategies() -> list:
     """
     List all available strategies
@@ -50,16 +70,7 @@ def list_strategies() -> list:
     Returns:
         List of strategy information dictionaries
     """
-    strategies = []
-    for strategy_id, strategy_class in STRATEGIES.items():
-        instance = strategy_class()
-        strategies.append({
-            'id': strategy_id,
-            'name': instance.name,
-            'description': instance.description,
-            'parameters': instance.parameters,
-        })
-    return strategies
+    return copy.deepcopy(list(_STRATEGY_META.values()))
 
 
 __all__ = [
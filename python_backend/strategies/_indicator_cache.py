@@ -0,0 +1,100 @@
+"""
+Shared Indicator Cache
+Computes each indicator once per DataFrame for all strategies that read it
+"""
+import threading
+import weakref
+from typing import Dict, Tuple
+import pandas as pd
+
+from indicators.technical import calculate_indicator
+
+
+class _FrameCache:
+    """Indicators computed for one source DataFrame"""
+    
+    __slots__ = ('source', 'series', 'frames')
+    
+    def __init__(self, df: pd.DataFrame):
+        self.source = weakref.ref(df)
+        self.series: Dict[Tuple, pd.Series] = {}
+        self.frames: Dict[Tuple, pd.DataFrame] = {}
+
+
+# Per-frame caches keyed by id(df); each holds its source only weakly and is
+# dropped when the source is garbage collected, so the cache never keeps a
+# DataFrame alive
+_CACHE: Dict[int, _FrameCache] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _discard(key: int, entry: _FrameCache):
+    """Drop a frame's cache once its source DataFrame is collected"""
+    # No lock: finalizers can run during garbage collection inside a locked
+    # section, and a single dict removal is atomic
+    if _CACHE.get(key) is entry:
+        _CACHE.pop(key, None)
+
+
+def _frame_cache(df: pd.DataFrame) -> _FrameCache:
+    """Get the cache for a DataFrame, creating it on first use"""
+    key = id(df)
+    with _CACHE_LOCK:
+        entry = _CACHE.get(key)
+        if entry is None or entry.source() is not df:
+            entry = _FrameCache(df)
+            _CACHE[key] = entry
+            weakref.finalize(df, _discard, key, entry)
+    return entry
+
+
+def get_indicator(df: pd.DataFrame, spec: Tuple) -> pd.Series:
+    """
+    Calculate an indicator, reusing the result for the same DataFrame
+    
+    The DataFrame must not be modified in place after its indicators have
+    been requested.
+    
+    Args:
+        df: DataFrame with OHLCV data
+        spec: Indicator kind followed by its arguments, e.g. ('rsi', 14)
+    
+    Returns:
+        Indicator as pandas Series
+    """
+    entry = _frame_cache(df)
+    series = entry.series.get(spec)
+    if series is None:
+        series = calculate_indicator(df, spec)
+        entry.series[spec] = series
+    return series
+
+
+def add_indicators(df: pd.DataFrame, indicators: Dict[str, Tuple]) -> pd.DataFrame:
+    """
+    Add the requested indicator columns, sharing computations across strategies
+    
+    Behaves like indicators.add_indicators, but each column comes from
+    get_indicator and the resulting DataFrame is reused for repeated
+    requests of the same indicators on the same data.
+    
+    Args:
+        df: DataFrame with OHLCV data
+        indicators: Mapping of column name to indicator spec
+    
+    Returns:
+        DataFrame with the indicator columns added
+    """
+    missing = {name: spec for name, spec in indicators.items() if name not in df.columns}
+    if not missing:
+        return df
+    
+    entry = _frame_cache(df)
+    key = tuple(missing.items())
+    result = entry.frames.get(key)
+    if result is None:
+        result = df.copy()
+        for name, spec in missing.items():
+            result[name] = get_indicator(df, spec)
+        entry.frames[key] = result
+    return result
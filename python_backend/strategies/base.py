@@ -2,15 +2,26 @@
 Base Strategy Class
 Provides abstract base class for all trading strategies
 """
+import weakref
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 from datetime import datetime
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel
 
+from ._indicator_cache import add_indicators, get_indicator
 
-class Signal(BaseModel):
-    """Trading signal"""
+
+# Vectorized signal codes
+SELL = -1
+HOLD = 0
+BUY = 1
+ACTION_CODES = {'sell': SELL, 'hold': HOLD, 'buy': BUY}
+
+
+class Signal(NamedTuple):
+    """Trading signal, a tuple so the one built per bar is cheap to create"""
     timestamp: datetime
     action: str  # 'buy', 'sell', or 'hold'
     confidence: float  # 0.0 to 1.0
@@ -19,7 +30,43 @@ class Signal(BaseModel):
     quantity: Optional[int] = None
 
 
-class Trade(BaseModel):
+def _column_values(column: pd.Series):
+    """Contiguous NumPy array for numeric columns, the pandas array (boxed scalars) otherwise"""
+    if column.dtype.kind in 'biuf':
+        # A column of a 2-D block built from row-major data is a strided view
+        return np.ascontiguousarray(column.to_numpy())
+    return column.array
+
+
+class MarketArrays(NamedTuple):
+    """Column arrays of an OHLCV DataFrame for fast per-bar indexing"""
+    timestamp: Any
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    
+    @classmethod
+    def from_df(cls, df: pd.DataFrame) -> 'MarketArrays':
+        """
+        Extract the OHLCV columns of a DataFrame
+        
+        Numeric columns are contiguous 1-D NumPy arrays, zero-copy views when
+        the column is already laid out that way; timestamps keep their pandas
+        array so indexing returns pd.Timestamp like iloc.
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            MarketArrays with one array per column
+        """
+        return cls(*(_column_values(df[name]) for name in cls._fields))
+
+
+@dataclass(slots=True, kw_only=True)
+class Trade:
     """Executed trade"""
     entry_time: datetime
     entry_price: float
@@ -45,6 +92,17 @@ class BaseStrategy(ABC):
         self.parameters = parameters or {}
         self.name = self.__class__.__name__
         self.description = self.__doc__ or "Trading strategy"
+        
+        # Indicator series and OHLCV arrays for the last DataFrame analyzed,
+        # which is only weakly referenced so the caches never keep it alive
+        self._cache_source: Optional[weakref.ref] = None
+        self._indicator_cache: Dict[str, pd.Series] = {}
+        self._indicator_values: Dict[str, np.ndarray] = {}
+        self._market_arrays: Optional[MarketArrays] = None
+        
+        # Hold signals skip formatting their reason when only actions are read
+        self._describe_holds = True
+        
         self._initialize()
     
     def _initialize(self):
@@ -65,6 +123,167 @@ class BaseStrategy(ABC):
         """
         pass
     
+    def required_indicators(self) -> Dict[str, Tuple]:
+        """
+        Indicators the strategy reads from the data
+        
+        The backtest engine adds these columns once before the bar loop so
+        ``analyze`` can look values up instead of recomputing each series.
+        
+        Returns:
+            Mapping of column name to indicator spec, e.g. {'sma_20': ('sma', 20)}
+        """
+        return {}
+    
+    def indicator(self, df: pd.DataFrame, name: str) -> pd.Series:
+        """
+        Get a required indicator, computing it if the column is missing
+        
+        Computed series are shared with other strategies reading the same
+        indicator and cached for the DataFrame until a different one is
+        passed or ``reset`` is called, so the DataFrame must not be modified
+        in place between calls.
+        
+        Args:
+            df: DataFrame with OHLCV data and indicators
+            name: Column name from required_indicators
+        
+        Returns:
+            Indicator as pandas Series
+        """
+        if name in df.columns:
+            return df[name]
+        
+        # Series are computed once per DataFrame, not once per bar
+        self._sync_cache(df)
+        series = self._indicator_cache.get(name)
+        if series is None:
+            series = get_indicator(df, self.required_indicators()[name])
+            self._indicator_cache[name] = series
+        return series
+    
+    def indicator_values(self, df: pd.DataFrame, name: str) -> np.ndarray:
+        """
+        Get a required indicator as a NumPy array for per-bar indexing
+        
+        Args:
+            df: DataFrame with OHLCV data and indicators
+            name: Column name from required_indicators
+        
+        Returns:
+            Indicator values, extracted once per DataFrame
+        """
+        self._sync_cache(df)
+        values = self._indicator_values.get(name)
+        if values is None:
+            values = np.ascontiguousarray(self.indicator(df, name).to_numpy())
+            self._indicator_values[name] = values
+        return values
+    
+    def market_arrays(self, df: pd.DataFrame) -> MarketArrays:
+        """
+        Get the OHLCV columns as arrays, extracted once per DataFrame
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            MarketArrays for the DataFrame
+        """
+        self._sync_cache(df)
+        if self._market_arrays is None:
+            self._market_arrays = MarketArrays.from_df(df)
+        return self._market_arrays
+    
+    def prepare(self, df: pd.DataFrame) -> MarketArrays:
+        """
+        Extract the OHLCV arrays and required indicators of a DataFrame once
+        
+        Later ``analyze`` calls for the same DataFrame only index the cached
+        arrays.
+        
+        Args:
+            df: DataFrame with OHLCV data and indicators
+        
+        Returns:
+            MarketArrays for the DataFrame
+        """
+        for name in self.required_indicators():
+            self.indicator_values(df, name)
+        return self.market_arrays(df)
+    
+    def _sync_cache(self, df: pd.DataFrame):
+        """Start fresh caches when a different DataFrame is analyzed"""
+        if self._cache_source is None or self._cache_source() is not df:
+            self._cache_source = weakref.ref(df)
+            self._indicator_cache = {}
+            self._indicator_values = {}
+            self._market_arrays = None
+    
+    def reset(self):
+        """Drop indicator series and arrays cached for the last DataFrame"""
+        self._cache_source = None
+        self._indicator_cache = {}
+        self._indicator_values = {}
+        self._market_arrays = None
+    
+    def analyze_batch(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """
+        Generate full signal details for every bar in one call
+        
+        The default implementation replays ``analyze`` bar by bar; strategies
+        override it with an array implementation where possible.
+        
+        Args:
+            df: DataFrame with OHLCV data and indicators
+        
+        Returns:
+            Tuple of (actions, confidences, prices, reasons) with one entry per
+            bar; actions are int8 signal codes (BUY, SELL or HOLD)
+        """
+        df = add_indicators(df, self.required_indicators())
+        self.prepare(df)
+        n = len(df)
+        actions = np.empty(n, dtype=np.int8)
+        confidences = np.empty(n, dtype=np.float64)
+        prices = np.empty(n, dtype=np.float64)
+        reasons = []
+        
+        for i in range(n):
+            signal = self.analyze(df, i)
+            actions[i] = ACTION_CODES[signal.action]
+            confidences[i] = signal.confidence
+            prices[i] = np.nan if signal.price is None else signal.price
+            reasons.append(signal.reason)
+        
+        return actions, confidences, prices, reasons
+    
+    def analyze_vectorized(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Generate signal codes for every bar in one call
+        
+        The default implementation replays ``analyze`` bar by bar, without
+        formatting hold reasons since only the actions are kept; strategies
+        override it with an array implementation where possible.
+        
+        Args:
+            df: DataFrame with OHLCV data and indicators
+        
+        Returns:
+            int8 array of signal codes (BUY, SELL or HOLD), one per bar
+        """
+        df = add_indicators(df, self.required_indicators())
+        self.prepare(df)
+        self._describe_holds = False
+        try:
+            return np.fromiter(
+                (ACTION_CODES[self.analyze(df, i).action] for i in range(len(df))),
+                dtype=np.int8,
+                count=len(df)
+            )
+        finally:
+            self._describe_holds = True
+    
     def get_info(self) -> Dict[str, Any]:
         """
         Get strategy information
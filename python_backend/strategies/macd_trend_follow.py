@@ -3,11 +3,73 @@ MACD Trend Following Strategy
 Buy when MACD line crosses above signal line (bullish)
 Sell when MACD line crosses below signal line (bearish)
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+import numpy as np
 import pandas as pd
 
-from .base import BaseStrategy, Signal
-from indicators.technical import calculate_macd
+from .base import BaseStrategy, Signal, BUY, SELL
+from ._indicator_cache import add_indicators
+from indicators._njit import njit
+
+
+# Reason templates, indexed by the reason codes of _macd_cross_scan
+_REASONS = (
+    'Insufficient data for MACD calculation',
+    'MACD bullish crossover: MACD line crossed above signal line (histogram: {:.4f})',
+    'MACD bearish crossover: MACD line crossed below signal line (histogram: {:.4f})',
+    'MACD bullish trend continues (histogram: {:.4f})',
+    'MACD bearish trend continues (histogram: {:.4f})',
+    'MACD neutral (histogram: {:.4f})',
+)
+
+
+@njit(cache=True)
+def _macd_cross_scan(macd, signal, histogram, min_required):
+    """
+    Detect MACD crossovers over whole series in one pass
+    
+    Args:
+        macd: MACD line
+        signal: Signal line
+        histogram: MACD histogram
+        min_required: Bars needed before the first signal
+    
+    Returns:
+        Tuple of (actions, confidences, reason_codes) with one entry per bar
+    """
+    n = macd.shape[0]
+    actions = np.zeros(n, dtype=np.int8)
+    confidences = np.zeros(n, dtype=np.float64)
+    reason_codes = np.zeros(n, dtype=np.int8)
+    
+    for i in range(min(min_required, n), n):
+        current_macd = macd[i]
+        current_signal = signal[i]
+        current_histogram = histogram[i]
+        previous_macd = macd[i - 1]
+        previous_signal = signal[i - 1]
+        
+        if previous_macd <= previous_signal and current_macd > current_signal:
+            actions[i] = BUY
+            reason_codes[i] = 1
+        elif previous_macd >= previous_signal and current_macd < current_signal:
+            actions[i] = SELL
+            reason_codes[i] = 2
+        else:
+            if current_histogram > 0 and current_macd > 0:
+                reason_codes[i] = 3
+            elif current_histogram < 0 and current_macd < 0:
+                reason_codes[i] = 4
+            else:
+                reason_codes[i] = 5
+            continue
+        
+        if current_macd != 0:
+            confidences[i] = min(abs(current_histogram) / abs(current_macd), 1.0)
+        else:
+            confidences[i] = 0.5
+    
+    return actions, confidences, reason_codes
 
 
 class MACDTrendFollowStrategy(BaseStrategy):
@@ -19,6 +81,17 @@ class MACDTrendFollowStrategy(BaseStrategy):
         self.slow_period = self.parameters.get('slow_period', 26)
         self.signal_period = self.parameters.get('signal_period', 9)
         self.description = f"MACD Trend Follow ({self.fast_period}/{self.slow_period}/{self.signal_period})"
+        self._macd_args = (self.fast_period, self.slow_period, self.signal_period)
+        self._macd_key = "_".join(map(str, self._macd_args))
+        self._min_required = self.slow_period + self.signal_period
+    
+    def required_indicators(self) -> Dict[str, Tuple]:
+        """Indicators read by analyze"""
+        return {
+            f'macd_{self._macd_key}': ('macd', *self._macd_args),
+            f'macd_signal_{self._macd_key}': ('macd_signal', *self._macd_args),
+            f'macd_histogram_{self._macd_key}': ('macd_histogram', *self._macd_args),
+        }
     
     def analyze(self, df: pd.DataFrame, index: int) -> Signal:
         """
@@ -31,52 +104,51 @@ class MACDTrendFollowStrategy(BaseStrategy):
         Returns:
             Trading signal
         """
+        bars = self.market_arrays(df)
+        timestamp = bars.timestamp[index]
+        close = bars.close[index]
+        
         # Need enough data for MACD calculation
-        min_required = self.slow_period + self.signal_period
-        if index < min_required:
+        if index < self._min_required:
             return Signal(
-                timestamp=df.iloc[index]['timestamp'],
+                timestamp=timestamp,
                 action='hold',
                 confidence=0.0,
                 reason='Insufficient data for MACD calculation',
-                price=df.iloc[index]['close']
+                price=close
             )
         
-        # Calculate MACD
-        close_prices = df['close']
-        macd_line, signal_line, histogram = calculate_macd(
-            close_prices,
-            self.fast_period,
-            self.slow_period,
-            self.signal_period
-        )
+        # Look up MACD
+        macd_line = self.indicator_values(df, f'macd_{self._macd_key}')
+        signal_line = self.indicator_values(df, f'macd_signal_{self._macd_key}')
+        histogram = self.indicator_values(df, f'macd_histogram_{self._macd_key}')
         
-        current_macd = macd_line.iloc[index]
-        current_signal = signal_line.iloc[index]
-        previous_macd = macd_line.iloc[index - 1]
-        previous_signal = signal_line.iloc[index - 1]
-        current_histogram = histogram.iloc[index]
+        current_macd = macd_line[index]
+        current_signal = signal_line[index]
+        previous_macd = macd_line[index - 1]
+        previous_signal = signal_line[index - 1]
+        current_histogram = histogram[index]
         
         # Bullish crossover: MACD crosses above signal line
         if previous_macd <= previous_signal and current_macd > current_signal:
             confidence = min(abs(current_histogram) / abs(current_macd) if current_macd != 0 else 0.5, 1.0)
             return Signal(
-                timestamp=df.iloc[index]['timestamp'],
+                timestamp=timestamp,
                 action='buy',
                 confidence=confidence,
                 reason=f'MACD bullish crossover: MACD line crossed above signal line (histogram: {current_histogram:.4f})',
-                price=df.iloc[index]['close']
+                price=close
             )
         
         # Bearish crossover: MACD crosses below signal line
         if previous_macd >= previous_signal and current_macd < current_signal:
             confidence = min(abs(current_histogram) / abs(current_macd) if current_macd != 0 else 0.5, 1.0)
             return Signal(
-                timestamp=df.iloc[index]['timestamp'],
+                timestamp=timestamp,
                 action='sell',
                 confidence=confidence,
                 reason=f'MACD bearish crossover: MACD line crossed below signal line (histogram: {current_histogram:.4f})',
-                price=df.iloc[index]['close']
+                price=close
             )
         
         # Trend continuation signals based on histogram strength
@@ -88,12 +160,53 @@ class MACDTrendFollowStrategy(BaseStrategy):
             reason = f'MACD neutral (histogram: {current_histogram:.4f})'
         
         return Signal(
-            timestamp=df.iloc[index]['timestamp'],
+            timestamp=timestamp,
             action='hold',
             confidence=0.0,
             reason=reason,
-            price=df.iloc[index]['close']
+            price=close
+        )
+    
+    def _scan(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Run the crossover scan over the whole DataFrame"""
+        df = add_indicators(df, self.required_indicators())
+        histogram = df[f'macd_histogram_{self._macd_key}'].to_numpy(dtype=np.float64)
+        actions, confidences, reason_codes = _macd_cross_scan(
+            df[f'macd_{self._macd_key}'].to_numpy(dtype=np.float64),
+            df[f'macd_signal_{self._macd_key}'].to_numpy(dtype=np.float64),
+            histogram,
+            self._min_required
         )
+        return actions, confidences, reason_codes, histogram
+    
+    def analyze_batch(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """
+        Generate full signal details for every bar with one crossover scan
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            Tuple of (actions, confidences, prices, reasons), one entry per bar
+        """
+        actions, confidences, reason_codes, histogram = self._scan(df)
+        reasons = [
+            _REASONS[code].format(value)
+            for code, value in zip(reason_codes.tolist(), histogram.tolist())
+        ]
+        return actions, confidences, df['close'].to_numpy(dtype=np.float64), reasons
+    
+    def analyze_vectorized(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Generate signal codes for every bar with one crossover scan
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            int8 array of signal codes (BUY, SELL or HOLD), one per bar
+        """
+        return self._scan(df)[0]
     
     @staticmethod
     def validate_parameters(parameters: Dict[str, Any]) -> bool:
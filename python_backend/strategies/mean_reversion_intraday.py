@@ -3,12 +3,105 @@ Mean Reversion Intraday Strategy
 Enter long when RSI(5) < 25 and no negative news
 Target small reversal before end of day
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 
-from .base import BaseStrategy, Signal
-from indicators.technical import calculate_rsi, calculate_bollinger_bands
+from .base import BaseStrategy, Signal, BUY, SELL
+from ._indicator_cache import add_indicators
+from indicators._njit import njit
+
+
+# Reason templates, indexed by the reason codes of _mean_reversion_scan and
+# formatted with (RSI, PnL %)
+_REASONS = (
+    'Insufficient data for calculations',
+    'Oversold signal: RSI={0:.1f}, near BB lower',
+    'RSI reversion: RSI={0:.1f}, PnL={1:.2f}%',
+    'BB mean reversion: PnL={1:.2f}%',
+    'Take-profit hit: {1:.2f}%',
+    'Stop-loss hit: {1:.2f}%',
+    'End of day exit: {1:.2f}%',
+    'Monitoring: RSI={0:.1f}',
+)
+
+
+@njit(cache=True)
+def _mean_reversion_scan(
+    close, rsi, bb_middle, bb_lower, min_required,
+    rsi_oversold, rsi_target, tp_mult, sl_mult,
+    position_open, entry_price
+):
+    """
+    Run the entry/exit state machine over whole series in one pass
+    
+    Args:
+        close: Close prices
+        rsi: RSI values
+        bb_middle: Middle Bollinger Band
+        bb_lower: Lower Bollinger Band
+        min_required: Bars needed before the first signal
+        rsi_oversold: RSI entry level
+        rsi_target: RSI exit level
+        tp_mult: Take-profit price as a multiple of the entry price
+        sl_mult: Stop-loss price as a multiple of the entry price
+        position_open: Whether a position is open before the first bar
+        entry_price: Entry price of that position
+    
+    Returns:
+        Tuple of (actions, confidences, reason_codes, pnl_pct, position_open,
+        entry_price) with one array entry per bar and the final position state
+    """
+    n = close.shape[0]
+    actions = np.zeros(n, dtype=np.int8)
+    confidences = np.zeros(n, dtype=np.float64)
+    reason_codes = np.full(n, 7, dtype=np.int8)
+    pnl = np.zeros(n, dtype=np.float64)
+    reason_codes[:min(min_required, n)] = 0
+    
+    for i in range(min(min_required, n), n):
+        price = close[i]
+        current_rsi = rsi[i]
+        
+        # Entry Logic: Oversold RSI, boosted when price is near the lower band
+        if not position_open:
+            if current_rsi < rsi_oversold:
+                position_open = True
+                entry_price = price
+                confidence = min(0.5 + ((rsi_oversold - current_rsi) / rsi_oversold) * 0.5, 1.0)
+                if price <= bb_lower[i] * 1.01:
+                    confidence = min(confidence + 0.2, 1.0)
+                actions[i] = BUY
+                confidences[i] = confidence
+                reason_codes[i] = 1
+            continue
+        
+        # Exit Logic: RSI recovery, BB middle, take-profit, stop-loss, or end of day
+        pnl[i] = ((price - entry_price) / entry_price) * 100
+        if current_rsi >= rsi_target:
+            code = 2
+            confidence = 0.8
+        elif price >= bb_middle[i]:
+            code = 3
+            confidence = 0.8
+        elif price >= entry_price * tp_mult:
+            code = 4
+            confidence = 0.9
+        elif price <= entry_price * sl_mult:
+            code = 5
+            confidence = 0.9
+        elif i >= n - 3:
+            code = 6
+            confidence = 0.8
+        else:
+            continue
+        
+        position_open = False
+        actions[i] = SELL
+        confidences[i] = confidence
+        reason_codes[i] = code
+    
+    return actions, confidences, reason_codes, pnl, position_open, entry_price
 
 
 class MeanReversionIntradayStrategy(BaseStrategy):
@@ -23,12 +116,23 @@ class MeanReversionIntradayStrategy(BaseStrategy):
         self.bb_std = self.parameters.get('bb_std', 2.0)
         self.take_profit_pct = self.parameters.get('take_profit_pct', 2.0)
         self.stop_loss_pct = self.parameters.get('stop_loss_pct', 1.5)
+        self._min_required = max(self.rsi_period + 1, self.bb_period)
+        self._tp_mult = 1 + self.take_profit_pct / 100
+        self._sl_mult = 1 - self.stop_loss_pct / 100
         self.description = f"Mean Reversion Intraday (RSI{self.rsi_period}<{self.rsi_oversold})"
         
         # Track position state
         self.position_open = False
         self.entry_price: Optional[float] = None
     
+    def required_indicators(self) -> Dict[str, Tuple]:
+        """Indicators read by analyze"""
+        return {
+            f'rsi_{self.rsi_period}': ('rsi', self.rsi_period),
+            f'bb_middle_{self.bb_period}_{self.bb_std}': ('bb_middle', self.bb_period, self.bb_std),
+            f'bb_lower_{self.bb_period}_{self.bb_std}': ('bb_lower', self.bb_period, self.bb_std),
+        }
+    
     def analyze(self, df: pd.DataFrame, index: int) -> Signal:
         """
         Analyze data and generate signal based on mean reversion
@@ -40,28 +144,29 @@ class MeanReversionIntradayStrategy(BaseStrategy):
         Returns:
             Trading signal
         """
+        bars = self.market_arrays(df)
+        timestamp = bars.timestamp[index]
+        close = bars.close[index]
+        
         # Need enough data for calculations
-        if index < max(self.rsi_period + 1, self.bb_period):
+        if index < self._min_required:
             return Signal(
-                timestamp=df.iloc[index]['timestamp'],
+                timestamp=timestamp,
                 action='hold',
                 confidence=0.0,
                 reason='Insufficient data for calculations',
-                price=df.iloc[index]['close']
+                price=close
             )
         
-        bar = df.iloc[index]
-        
-        # Calculate RSI
-        rsi = calculate_rsi(df['close'], self.rsi_period)
-        current_rsi = rsi.iloc[index]
+        # Look up RSI
+        rsi = self.indicator_values(df, f'rsi_{self.rsi_period}')
+        current_rsi = rsi[index]
         
-        # Calculate Bollinger Bands for additional confirmation
-        bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(
-            df['close'], self.bb_period, self.bb_std
-        )
-        current_bb_lower = bb_lower.iloc[index]
-        current_bb_middle = bb_middle.iloc[index]
+        # Bollinger Bands for additional confirmation
+        bb_middle = self.indicator_values(df, f'bb_middle_{self.bb_period}_{self.bb_std}')
+        bb_lower = self.indicator_values(df, f'bb_lower_{self.bb_period}_{self.bb_std}')
+        current_bb_lower = bb_lower[index]
+        current_bb_middle = bb_middle[index]
         
         # Check if near end of day
         is_closing_period = index >= len(df) - 3
@@ -71,10 +176,10 @@ class MeanReversionIntradayStrategy(BaseStrategy):
             # Check if RSI is oversold
             if current_rsi < self.rsi_oversold:
                 # Additional confirmation: price near lower BB
-                near_lower_bb = bar['close'] <= current_bb_lower * 1.01
+                near_lower_bb = close <= current_bb_lower * 1.01
                 
                 self.position_open = True
-                self.entry_price = bar['close']
+                self.entry_price = close
                 
                 # Confidence based on how oversold
                 confidence = min(
@@ -86,65 +191,65 @@ class MeanReversionIntradayStrategy(BaseStrategy):
                     confidence = min(confidence + 0.2, 1.0)
                 
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='buy',
                     confidence=confidence,
                     reason=f'Oversold signal: RSI={current_rsi:.1f}, near BB lower',
-                    price=bar['close']
+                    price=close
                 )
         
         # Exit Logic: RSI recovery, take-profit, stop-loss, or end of day
         if self.position_open and self.entry_price is not None:
-            pnl_pct = ((bar['close'] - self.entry_price) / self.entry_price) * 100
+            pnl_pct = ((close - self.entry_price) / self.entry_price) * 100
             
             # Mean reversion: RSI recovers to target level
             if current_rsi >= self.rsi_target:
                 self.position_open = False
                 self.entry_price = None
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.8,
                     reason=f'RSI reversion: RSI={current_rsi:.1f}, PnL={pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
             
             # Price back to BB middle
-            if bar['close'] >= current_bb_middle:
+            if close >= current_bb_middle:
                 self.position_open = False
                 self.entry_price = None
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.8,
                     reason=f'BB mean reversion: PnL={pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
             
             # Take-profit
-            take_profit_price = self.entry_price * (1 + self.take_profit_pct / 100)
-            if bar['close'] >= take_profit_price:
+            take_profit_price = self.entry_price * self._tp_mult
+            if close >= take_profit_price:
                 self.position_open = False
                 self.entry_price = None
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.9,
                     reason=f'Take-profit hit: {pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
             
             # Stop-loss
-            stop_loss_price = self.entry_price * (1 - self.stop_loss_pct / 100)
-            if bar['close'] <= stop_loss_price:
+            stop_loss_price = self.entry_price * self._sl_mult
+            if close <= stop_loss_price:
                 self.position_open = False
                 self.entry_price = None
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.9,
                     reason=f'Stop-loss hit: {pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
             
             # End of day
@@ -152,20 +257,70 @@ class MeanReversionIntradayStrategy(BaseStrategy):
                 self.position_open = False
                 self.entry_price = None
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.8,
                     reason=f'End of day exit: {pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
         
         return Signal(
-            timestamp=bar['timestamp'],
+            timestamp=timestamp,
             action='hold',
             confidence=0.0,
-            reason=f'Monitoring: RSI={current_rsi:.1f}',
-            price=bar['close']
+            reason=f'Monitoring: RSI={current_rsi:.1f}' if self._describe_holds else '',
+            price=close
+        )
+    
+    def _scan(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Run the state machine over the whole DataFrame, carrying the position state"""
+        df = add_indicators(df, self.required_indicators())
+        rsi = df[f'rsi_{self.rsi_period}'].to_numpy(dtype=np.float64)
+        actions, confidences, reason_codes, pnl, position_open, entry_price = _mean_reversion_scan(
+            df['close'].to_numpy(dtype=np.float64),
+            rsi,
+            df[f'bb_middle_{self.bb_period}_{self.bb_std}'].to_numpy(dtype=np.float64),
+            df[f'bb_lower_{self.bb_period}_{self.bb_std}'].to_numpy(dtype=np.float64),
+            self._min_required,
+            float(self.rsi_oversold),
+            float(self.rsi_target),
+            float(self._tp_mult),
+            float(self._sl_mult),
+            self.position_open and self.entry_price is not None,
+            float(self.entry_price or 0.0)
         )
+        self.position_open = position_open
+        self.entry_price = entry_price if position_open else None
+        return actions, confidences, reason_codes, rsi, pnl
+    
+    def analyze_batch(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """
+        Generate full signal details for every bar with one state-machine pass
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            Tuple of (actions, confidences, prices, reasons), one entry per bar
+        """
+        actions, confidences, reason_codes, rsi, pnl = self._scan(df)
+        reasons = [
+            _REASONS[code].format(value, pnl_pct)
+            for code, value, pnl_pct in zip(reason_codes.tolist(), rsi.tolist(), pnl.tolist())
+        ]
+        return actions, confidences, df['close'].to_numpy(dtype=np.float64), reasons
+    
+    def analyze_vectorized(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Generate signal codes for every bar with one state-machine pass
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            int8 array of signal codes (BUY, SELL or HOLD), one per bar
+        """
+        return self._scan(df)[0]
     
     @staticmethod
     def validate_parameters(parameters: Dict[str, Any]) -> bool:
@@ -4,12 +4,103 @@ Buy stocks that gap up > 2% on high pre-market volume
 Filters: RSI(5) < 70, volume ratio > 2× 20-day avg
 Entry at open, exit before close or if trailing stop hits
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import pandas as pd
 import numpy as np
 
-from .base import BaseStrategy, Signal
-from indicators.technical import calculate_rsi, calculate_sma
+from .base import BaseStrategy, Signal, BUY, SELL
+from ._indicator_cache import add_indicators
+from indicators._njit import njit
+
+
+# Reason templates, indexed by the reason codes of _morning_momentum_scan and
+# formatted with (gap %, RSI, volume ratio)
+_REASONS = (
+    'Insufficient data for calculations',
+    'Morning gap up: {0:.2f}% gap, RSI={1:.1f}, vol_ratio={2:.1f}x',
+    'Trailing stop hit',
+    'End of day exit',
+    'Monitoring: gap={0:.2f}%, RSI={1:.1f}, vol_ratio={2:.1f}x',
+)
+
+
+@njit(cache=True)
+def _morning_momentum_scan(
+    open_, close, volume, rsi, avg_volume, min_required,
+    gap_threshold, rsi_max, volume_ratio_min, trail_mult,
+    position_open, highest_price
+):
+    """
+    Run the entry/exit state machine over whole series in one pass
+    
+    Args:
+        open_: Open prices
+        close: Close prices
+        volume: Volumes
+        rsi: RSI values
+        avg_volume: Trailing mean volume
+        min_required: Bars needed before the first signal
+        gap_threshold: Minimum gap up in percent
+        rsi_max: RSI ceiling for entries
+        volume_ratio_min: Minimum volume ratio for entries
+        trail_mult: Trailing stop as a multiple of the highest price
+        position_open: Whether a position is open before the first bar
+        highest_price: Highest close since that position was opened
+    
+    Returns:
+        Tuple of (actions, confidences, reason_codes, gap_pct, volume_ratio,
+        position_open, highest_price) with one array entry per bar and the
+        final position state
+    """
+    n = close.shape[0]
+    actions = np.zeros(n, dtype=np.int8)
+    confidences = np.zeros(n, dtype=np.float64)
+    reason_codes = np.full(n, 4, dtype=np.int8)
+    gaps = np.zeros(n, dtype=np.float64)
+    ratios = np.zeros(n, dtype=np.float64)
+    reason_codes[:min(min_required, n)] = 0
+    
+    for i in range(min(min_required, n), n):
+        price = close[i]
+        current_rsi = rsi[i]
+        gap_pct = ((open_[i] - close[i - 1]) / close[i - 1]) * 100
+        volume_ratio = volume[i] / avg_volume[i] if avg_volume[i] > 0 else 0.0
+        gaps[i] = gap_pct
+        ratios[i] = volume_ratio
+        
+        # Entry Logic: Gap up with momentum and volume confirmation
+        if not position_open:
+            if (gap_pct >= gap_threshold and
+                    current_rsi < rsi_max and
+                    volume_ratio >= volume_ratio_min):
+                position_open = True
+                highest_price = price
+                actions[i] = BUY
+                confidences[i] = min(
+                    (gap_pct / (gap_threshold * 2)) * 0.4 +
+                    (volume_ratio / (volume_ratio_min * 2)) * 0.4 +
+                    ((rsi_max - current_rsi) / rsi_max) * 0.2,
+                    1.0
+                )
+                reason_codes[i] = 1
+            continue
+        
+        # Exit Logic: Trailing stop or end of day
+        if price > highest_price:
+            highest_price = price
+        if price <= highest_price * trail_mult:
+            code = 2
+        elif i >= n - 3:
+            code = 3
+        else:
+            continue
+        
+        position_open = False
+        actions[i] = SELL
+        confidences[i] = 0.8
+        reason_codes[i] = code
+    
+    return actions, confidences, reason_codes, gaps, ratios, position_open, highest_price
 
 
 class MorningMomentumStrategy(BaseStrategy):
@@ -22,13 +113,25 @@ class MorningMomentumStrategy(BaseStrategy):
         self.rsi_max = self.parameters.get('rsi_max', 70)
         self.volume_ratio_min = self.parameters.get('volume_ratio_min', 2.0)
         self.volume_period = self.parameters.get('volume_period', 20)
+        self.volume_average = self.parameters.get('volume_average', 'sma')  # trailing 'sma' or 'ema' baseline
+        self._avg_volume_kind = 'volume_ema' if self.volume_average == 'ema' else 'volume_mean'
+        self._avg_volume_column = f'{self._avg_volume_kind}_{self.volume_period}'
         self.trailing_stop_pct = self.parameters.get('trailing_stop_pct', 2.0)
+        self._min_required = max(self.rsi_period + 1, self.volume_period)
+        self._trail_mult = 1 - self.trailing_stop_pct / 100
         self.description = f"Morning Momentum (gap>{self.gap_threshold}%, RSI<{self.rsi_max}, vol>{self.volume_ratio_min}x)"
         
         # Track position state for trailing stop
         self.position_open = False
         self.highest_price = None
     
+    def required_indicators(self) -> Dict[str, Tuple]:
+        """Indicators read by analyze"""
+        return {
+            f'rsi_{self.rsi_period}': ('rsi', self.rsi_period),
+            self._avg_volume_column: (self._avg_volume_kind, self.volume_period),
+        }
+    
     def analyze(self, df: pd.DataFrame, index: int) -> Signal:
         """
         Analyze data and generate signal based on morning momentum
@@ -40,29 +143,30 @@ class MorningMomentumStrategy(BaseStrategy):
         Returns:
             Trading signal
         """
+        bars = self.market_arrays(df)
+        timestamp = bars.timestamp[index]
+        close = bars.close[index]
+        
         # Need enough data for calculations
-        if index < max(self.rsi_period + 1, self.volume_period):
+        if index < self._min_required:
             return Signal(
-                timestamp=df.iloc[index]['timestamp'],
+                timestamp=timestamp,
                 action='hold',
                 confidence=0.0,
                 reason='Insufficient data for calculations',
-                price=df.iloc[index]['close']
+                price=close
             )
         
-        bar = df.iloc[index]
-        prev_bar = df.iloc[index - 1]
-        
         # Calculate gap percentage (open vs previous close)
-        gap_pct = ((bar['open'] - prev_bar['close']) / prev_bar['close']) * 100
+        gap_pct = ((bars.open[index] - bars.close[index - 1]) / bars.close[index - 1]) * 100
         
-        # Calculate RSI
-        rsi = calculate_rsi(df['close'], self.rsi_period)
-        current_rsi = rsi.iloc[index]
+        # Look up RSI
+        rsi = self.indicator_values(df, f'rsi_{self.rsi_period}')
+        current_rsi = rsi[index]
         
         # Calculate volume ratio (current volume vs average)
-        avg_volume = df['volume'].iloc[index - self.volume_period:index].mean()
-        volume_ratio = bar['volume'] / avg_volume if avg_volume > 0 else 0
+        avg_volume = self.indicator_values(df, self._avg_volume_column)[index]
+        volume_ratio = bars.volume[index] / avg_volume if avg_volume > 0 else 0
         
         # Check if this is near market open (first bars of the day)
         # For intraday data, we assume early bars are open periods
@@ -79,7 +183,7 @@ class MorningMomentumStrategy(BaseStrategy):
                 volume_ratio >= self.volume_ratio_min):
                 
                 self.position_open = True
-                self.highest_price = bar['close']
+                self.highest_price = close
                 
                 confidence = min(
                     (gap_pct / (self.gap_threshold * 2)) * 0.4 +
@@ -89,44 +193,97 @@ class MorningMomentumStrategy(BaseStrategy):
                 )
                 
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='buy',
                     confidence=confidence,
                     reason=f'Morning gap up: {gap_pct:.2f}% gap, RSI={current_rsi:.1f}, vol_ratio={volume_ratio:.1f}x',
-                    price=bar['close']
+                    price=close
                 )
         
         # Exit Logic: Trailing stop or end of day
         if self.position_open:
             # Update highest price for trailing stop
-            if bar['close'] > self.highest_price:
-                self.highest_price = bar['close']
+            if close > self.highest_price:
+                self.highest_price = close
             
             # Check trailing stop
-            trailing_stop_price = self.highest_price * (1 - self.trailing_stop_pct / 100)
+            trailing_stop_price = self.highest_price * self._trail_mult
             
-            if bar['close'] <= trailing_stop_price or is_market_close_period:
+            if close <= trailing_stop_price or is_market_close_period:
                 self.position_open = False
                 self.highest_price = None
                 
-                reason = 'Trailing stop hit' if bar['close'] <= trailing_stop_price else 'End of day exit'
+                reason = 'Trailing stop hit' if close <= trailing_stop_price else 'End of day exit'
                 
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.8,
                     reason=reason,
-                    price=bar['close']
+                    price=close
                 )
         
         return Signal(
-            timestamp=bar['timestamp'],
+            timestamp=timestamp,
             action='hold',
             confidence=0.0,
-            reason=f'Monitoring: gap={gap_pct:.2f}%, RSI={current_rsi:.1f}, vol_ratio={volume_ratio:.1f}x',
-            price=bar['close']
+            reason=f'Monitoring: gap={gap_pct:.2f}%, RSI={current_rsi:.1f}, vol_ratio={volume_ratio:.1f}x' if self._describe_holds else '',
+            price=close
         )
     
+    def _scan(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Run the state machine over the whole DataFrame, carrying the position state"""
+        df = add_indicators(df, self.required_indicators())
+        rsi = df[f'rsi_{self.rsi_period}'].to_numpy(dtype=np.float64)
+        actions, confidences, reason_codes, gaps, ratios, position_open, highest_price = _morning_momentum_scan(
+            df['open'].to_numpy(dtype=np.float64),
+            df['close'].to_numpy(dtype=np.float64),
+            df['volume'].to_numpy(dtype=np.float64),
+            rsi,
+            df[self._avg_volume_column].to_numpy(dtype=np.float64),
+            self._min_required,
+            float(self.gap_threshold),
+            float(self.rsi_max),
+            float(self.volume_ratio_min),
+            float(self._trail_mult),
+            self.position_open and self.highest_price is not None,
+            float(self.highest_price or 0.0)
+        )
+        self.position_open = position_open
+        self.highest_price = highest_price if position_open else None
+        return actions, confidences, reason_codes, gaps, rsi, ratios
+    
+    def analyze_batch(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """
+        Generate full signal details for every bar with one state-machine pass
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            Tuple of (actions, confidences, prices, reasons), one entry per bar
+        """
+        actions, confidences, reason_codes, gaps, rsi, ratios = self._scan(df)
+        reasons = [
+            _REASONS[code].format(gap_pct, value, volume_ratio)
+            for code, gap_pct, value, volume_ratio in zip(
+                reason_codes.tolist(), gaps.tolist(), rsi.tolist(), ratios.tolist()
+            )
+        ]
+        return actions, confidences, df['close'].to_numpy(dtype=np.float64), reasons
+    
+    def analyze_vectorized(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Generate signal codes for every bar with one state-machine pass
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            int8 array of signal codes (BUY, SELL or HOLD), one per bar
+        """
+        return self._scan(df)[0]
+    
     @staticmethod
     def validate_parameters(parameters: Dict[str, Any]) -> bool:
         """Validate strategy parameters"""
@@ -143,5 +300,7 @@ class MorningMomentumStrategy(BaseStrategy):
             raise ValueError("RSI max must be between 0 and 100")
         if volume_ratio_min <= 0:
             raise ValueError("Volume ratio min must be positive")
+        if parameters.get('volume_average', 'sma') not in ('sma', 'ema'):
+            raise ValueError("Volume average must be 'sma' or 'ema'")
         
         return True
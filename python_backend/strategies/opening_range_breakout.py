@@ -4,12 +4,128 @@ Identifies first 30-min high/low
 Enters long when price breaks above high with volume confirmation
 Exits on stop-loss or end of day
 """
-from typing import Dict, Any, Optional
+import weakref
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime
 import pandas as pd
 import numpy as np
 
-from .base import BaseStrategy, Signal
-from indicators.technical import calculate_sma
+from .base import BaseStrategy, Signal, BUY, SELL
+from ._indicator_cache import add_indicators
+from indicators._njit import njit
+from indicators.technical import calculate_sma, opening_range_bars
+
+
+# Reason templates, indexed by the reason codes of _opening_range_scan and
+# formatted with (range high, range low, volume ratio, PnL %)
+_REASONS = (
+    'Insufficient data',
+    'Establishing opening range: H={0:.2f}, L={1:.2f}',
+    'Breakout above OR high {0:.2f}, vol_ratio={2:.1f}x',
+    'Stop-loss hit: {3:.2f}%',
+    'Take-profit hit: {3:.2f}%',
+    'End of day exit: {3:.2f}%',
+    'Monitoring: OR H={0:.2f}, L={1:.2f}',
+)
+
+
+@njit(cache=True)
+def _opening_range_scan(
+    opening_high, opening_low, close, volume, avg_volume, range_bars,
+    volume_confirmation, volume_threshold, sl_mult, tp_mult,
+    range_high, range_low, range_set, position_open, entry_price
+):
+    """
+    Run the opening range and entry/exit state machine over whole series in one pass
+    
+    Args:
+        opening_high: Opening range high as of each bar
+        opening_low: Opening range low as of each bar
+        close: Close prices
+        volume: Volumes
+        avg_volume: Trailing mean volume
+        range_bars: Bars that make up the opening range
+        volume_confirmation: Whether breakouts need a volume surge
+        volume_threshold: Minimum volume ratio for a confirmed breakout
+        sl_mult: Stop-loss price as a multiple of the entry price
+        tp_mult: Take-profit price as a multiple of the entry price
+        range_high: Opening range high before the first bar (NaN if unknown)
+        range_low: Opening range low before the first bar (NaN if unknown)
+        range_set: Whether the opening range is already final
+        position_open: Whether a position is open before the first bar
+        entry_price: Entry price of that position
+    
+    Returns:
+        Tuple of (actions, confidences, reason_codes, range_high, range_low,
+        volume_ratio, pnl_pct) with one array entry per bar, followed by the
+        final (range_high, range_low, range_set, position_open, entry_price)
+    """
+    n = close.shape[0]
+    actions = np.zeros(n, dtype=np.int8)
+    confidences = np.zeros(n, dtype=np.float64)
+    reason_codes = np.zeros(n, dtype=np.int8)
+    highs = np.full(n, np.nan)
+    lows = np.full(n, np.nan)
+    ratios = np.zeros(n, dtype=np.float64)
+    pnl = np.zeros(n, dtype=np.float64)
+    
+    for i in range(min(2, n), n):
+        price = close[i]
+        
+        # Track the opening range over the first range_bars bars
+        if i < range_bars:
+            if not range_set:
+                range_high = opening_high[i]
+                range_low = opening_low[i]
+            highs[i] = range_high
+            lows[i] = range_low
+            reason_codes[i] = 1
+            continue
+        
+        if not range_set:
+            range_set = True
+            range_high = opening_high[range_bars - 1]
+            range_low = opening_low[range_bars - 1]
+        highs[i] = range_high
+        lows[i] = range_low
+        reason_codes[i] = 6
+        
+        volume_ratio = volume[i] / avg_volume[i] if avg_volume[i] > 0 else 1.0
+        ratios[i] = volume_ratio
+        
+        # Entry Logic: Breakout above opening range high
+        if not position_open:
+            if price > range_high and (not volume_confirmation or volume_ratio >= volume_threshold):
+                position_open = True
+                entry_price = price
+                actions[i] = BUY
+                confidences[i] = min(0.6 + (volume_ratio / (volume_threshold * 2)) * 0.4, 1.0)
+                reason_codes[i] = 2
+            continue
+        
+        # Exit Logic: Stop-loss, take-profit, or end of day
+        pnl[i] = ((price - entry_price) / entry_price) * 100
+        if price <= entry_price * sl_mult:
+            code = 3
+            confidence = 0.9
+        elif price >= entry_price * tp_mult:
+            code = 4
+            confidence = 0.9
+        elif i >= n - 3:
+            code = 5
+            confidence = 0.8
+        else:
+            continue
+        
+        position_open = False
+        actions[i] = SELL
+        confidences[i] = confidence
+        reason_codes[i] = code
+    
+    return (
+        actions, confidences, reason_codes, highs, lows, ratios, pnl,
+        range_high, range_low, range_set, position_open, entry_price
+    )
 
 
 class OpeningRangeBreakoutStrategy(BaseStrategy):
@@ -20,8 +136,13 @@ class OpeningRangeBreakoutStrategy(BaseStrategy):
         self.range_period = self.parameters.get('range_period', 30)  # minutes for opening range
         self.volume_confirmation = self.parameters.get('volume_confirmation', True)
         self.volume_threshold = self.parameters.get('volume_threshold', 1.5)  # vs avg volume
+        self.volume_average = self.parameters.get('volume_average', 'sma')  # trailing 'sma' or 'ema' baseline
+        self._avg_volume_kind = 'volume_ema' if self.volume_average == 'ema' else 'volume_mean'
+        self._avg_volume_column = f'{self._avg_volume_kind}_20'
         self.stop_loss_pct = self.parameters.get('stop_loss_pct', 1.5)
         self.take_profit_pct = self.parameters.get('take_profit_pct', 3.0)
+        self._sl_mult = 1 - self.stop_loss_pct / 100
+        self._tp_mult = 1 + self.take_profit_pct / 100
         self.description = f"Opening Range Breakout ({self.range_period}min range)"
         
         # Track opening range
@@ -30,6 +151,33 @@ class OpeningRangeBreakoutStrategy(BaseStrategy):
         self.opening_range_set = False
         self.position_open = False
         self.entry_price: Optional[float] = None
+        
+        # Bar count of the opening range, found once per DataFrame
+        self._range_source: Optional[weakref.ref] = None
+        self._range_bars = 0
+    
+    def _opening_range_bars(self, df: pd.DataFrame) -> int:
+        """
+        Number of bars in the first range_period minutes of the DataFrame
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            Bar count of the opening range
+        """
+        if self._range_source is None or self._range_source() is not df:
+            self._range_source = weakref.ref(df)
+            self._range_bars = opening_range_bars(df['timestamp'], self.range_period)
+        return self._range_bars
+    
+    def required_indicators(self) -> Dict[str, Tuple]:
+        """Indicators read by analyze"""
+        return {
+            f'opening_high_{self.range_period}': ('opening_high', self.range_period),
+            f'opening_low_{self.range_period}': ('opening_low', self.range_period),
+            self._avg_volume_column: (self._avg_volume_kind, 20),
+        }
     
     def analyze(self, df: pd.DataFrame, index: int) -> Signal:
         """
@@ -42,123 +190,212 @@ class OpeningRangeBreakoutStrategy(BaseStrategy):
         Returns:
             Trading signal
         """
+        bars = self.market_arrays(df)
+        timestamp = bars.timestamp[index]
+        close = bars.close[index]
+        
         # Need minimum data
         if index < 2:
             return Signal(
-                timestamp=df.iloc[index]['timestamp'],
+                timestamp=timestamp,
                 action='hold',
                 confidence=0.0,
                 reason='Insufficient data',
-                price=df.iloc[index]['close']
+                price=close
             )
         
-        bar = df.iloc[index]
-        
-        # Determine if we're in the opening range period
-        # For simplicity, assume first 'range_period' bars define the opening range
-        # In production, you'd check actual timestamps
-        is_opening_period = index < self.range_period
-        is_closing_period = index >= len(df) - 3
-        
-        # Set opening range
-        if is_opening_period:
-            if not self.opening_range_set:
-                # Calculate opening range from bars so far
-                opening_bars = df.iloc[:index + 1]
-                self.opening_range_high = opening_bars['high'].max()
-                self.opening_range_low = opening_bars['low'].min()
-            
-            return Signal(
-                timestamp=bar['timestamp'],
-                action='hold',
-                confidence=0.0,
-                reason=f'Establishing opening range: H={self.opening_range_high:.2f}, L={self.opening_range_low:.2f}',
-                price=bar['close']
-            )
+        # Bars that start within the first range_period minutes build the
+        # opening range; breakouts are traded after it
+        range_bars = self._opening_range_bars(df)
+        if index < range_bars:
+            return self._opening_phase(df, index, timestamp, close)
+        return self._trading_phase(df, index, range_bars, timestamp, close)
+    
+    def _opening_phase(self, df: pd.DataFrame, index: int, timestamp: datetime, close: float) -> Signal:
+        """
+        Track the opening range while it is being established
+        
+        Args:
+            df: DataFrame with OHLCV data
+            index: Current bar index, inside the opening range
+            timestamp: Bar timestamp
+            close: Bar close
+        
+        Returns:
+            Hold signal
+        """
+        if not self.opening_range_set:
+            # Opening range from bars so far
+            self.opening_range_high = self.indicator_values(df, f'opening_high_{self.range_period}')[index]
+            self.opening_range_low = self.indicator_values(df, f'opening_low_{self.range_period}')[index]
+        
+        return Signal(
+            timestamp=timestamp,
+            action='hold',
+            confidence=0.0,
+            reason=f'Establishing opening range: H={self.opening_range_high:.2f}, L={self.opening_range_low:.2f}' if self._describe_holds else '',
+            price=close
+        )
+    
+    def _trading_phase(
+        self,
+        df: pd.DataFrame,
+        index: int,
+        range_bars: int,
+        timestamp: datetime,
+        close: float
+    ) -> Signal:
+        """
+        Trade breakouts of the finished opening range
+        
+        Args:
+            df: DataFrame with OHLCV data
+            index: Current bar index, after the opening range
+            range_bars: Bar count of the opening range
+            timestamp: Bar timestamp
+            close: Bar close
         
+        Returns:
+            Trading signal
+        """
         # Finalize opening range after period ends
         if not self.opening_range_set:
             self.opening_range_set = True
-            opening_bars = df.iloc[:self.range_period]
-            self.opening_range_high = opening_bars['high'].max()
-            self.opening_range_low = opening_bars['low'].min()
+            self.opening_range_high = self.indicator_values(df, f'opening_high_{self.range_period}')[range_bars - 1]
+            self.opening_range_low = self.indicator_values(df, f'opening_low_{self.range_period}')[range_bars - 1]
         
         # Calculate average volume for confirmation
-        avg_volume = df['volume'].iloc[max(0, index - 20):index].mean()
-        volume_ratio = bar['volume'] / avg_volume if avg_volume > 0 else 1.0
+        avg_volume = self.indicator_values(df, self._avg_volume_column)[index]
+        volume_ratio = self.market_arrays(df).volume[index] / avg_volume if avg_volume > 0 else 1.0
         
-        # Entry Logic: Breakout above opening range high
-        if not self.position_open and self.opening_range_high is not None:
-            if bar['close'] > self.opening_range_high:
-                # Check volume confirmation
-                volume_confirmed = not self.volume_confirmation or volume_ratio >= self.volume_threshold
+        # Entry Logic: Breakout above opening range high with volume confirmation
+        if not self.position_open:
+            if close > self.opening_range_high and (
+                not self.volume_confirmation or volume_ratio >= self.volume_threshold
+            ):
+                self.position_open = True
+                self.entry_price = close
+                
+                confidence = min(
+                    0.6 + (volume_ratio / (self.volume_threshold * 2)) * 0.4,
+                    1.0
+                )
                 
-                if volume_confirmed:
-                    self.position_open = True
-                    self.entry_price = bar['close']
-                    
-                    breakout_strength = (bar['close'] - self.opening_range_high) / self.opening_range_high
-                    confidence = min(
-                        0.6 + (volume_ratio / (self.volume_threshold * 2)) * 0.4,
-                        1.0
-                    )
-                    
-                    return Signal(
-                        timestamp=bar['timestamp'],
-                        action='buy',
-                        confidence=confidence,
-                        reason=f'Breakout above OR high {self.opening_range_high:.2f}, vol_ratio={volume_ratio:.1f}x',
-                        price=bar['close']
-                    )
+                return Signal(
+                    timestamp=timestamp,
+                    action='buy',
+                    confidence=confidence,
+                    reason=f'Breakout above OR high {self.opening_range_high:.2f}, vol_ratio={volume_ratio:.1f}x',
+                    price=close
+                )
         
         # Exit Logic: Stop-loss, take-profit, or end of day
-        if self.position_open and self.entry_price is not None:
-            pnl_pct = ((bar['close'] - self.entry_price) / self.entry_price) * 100
-            stop_loss_price = self.entry_price * (1 - self.stop_loss_pct / 100)
-            take_profit_price = self.entry_price * (1 + self.take_profit_pct / 100)
+        elif self.entry_price is not None:
+            pnl_pct = ((close - self.entry_price) / self.entry_price) * 100
+            stop_loss_price = self.entry_price * self._sl_mult
+            take_profit_price = self.entry_price * self._tp_mult
             
             # Check exit conditions
-            if bar['close'] <= stop_loss_price:
+            if close <= stop_loss_price:
                 self.position_open = False
                 self.entry_price = None
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.9,
                     reason=f'Stop-loss hit: {pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
             
-            if bar['close'] >= take_profit_price:
+            if close >= take_profit_price:
                 self.position_open = False
                 self.entry_price = None
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.9,
                     reason=f'Take-profit hit: {pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
             
-            if is_closing_period:
+            if index >= len(df) - 3:
                 self.position_open = False
                 self.entry_price = None
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.8,
                     reason=f'End of day exit: {pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
         
         return Signal(
-            timestamp=bar['timestamp'],
+            timestamp=timestamp,
             action='hold',
             confidence=0.0,
-            reason=f'Monitoring: OR H={self.opening_range_high:.2f}, L={self.opening_range_low:.2f}',
-            price=bar['close']
+            reason=f'Monitoring: OR H={self.opening_range_high:.2f}, L={self.opening_range_low:.2f}' if self._describe_holds else '',
+            price=close
         )
     
+    def _scan(self, df: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+        """Run the state machine over the whole DataFrame, carrying the range and position state"""
+        df = add_indicators(df, self.required_indicators())
+        (actions, confidences, reason_codes, highs, lows, ratios, pnl,
+         range_high, range_low, range_set, position_open, entry_price) = _opening_range_scan(
+            df[f'opening_high_{self.range_period}'].to_numpy(dtype=np.float64),
+            df[f'opening_low_{self.range_period}'].to_numpy(dtype=np.float64),
+            df['close'].to_numpy(dtype=np.float64),
+            df['volume'].to_numpy(dtype=np.float64),
+            df[self._avg_volume_column].to_numpy(dtype=np.float64),
+            self._opening_range_bars(df),
+            bool(self.volume_confirmation),
+            float(self.volume_threshold),
+            float(self._sl_mult),
+            float(self._tp_mult),
+            np.nan if self.opening_range_high is None else float(self.opening_range_high),
+            np.nan if self.opening_range_low is None else float(self.opening_range_low),
+            self.opening_range_set,
+            self.position_open and self.entry_price is not None,
+            float(self.entry_price or 0.0)
+        )
+        self.opening_range_high = None if np.isnan(range_high) else range_high
+        self.opening_range_low = None if np.isnan(range_low) else range_low
+        self.opening_range_set = range_set
+        self.position_open = position_open
+        self.entry_price = entry_price if position_open else None
+        return actions, confidences, reason_codes, highs, lows, ratios, pnl
+    
+    def analyze_batch(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """
+        Generate full signal details for every bar with one state-machine pass
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            Tuple of (actions, confidences, prices, reasons), one entry per bar
+        """
+        actions, confidences, reason_codes, highs, lows, ratios, pnl = self._scan(df)
+        reasons = [
+            _REASONS[code].format(*values)
+            for code, *values in zip(
+                reason_codes.tolist(), highs.tolist(), lows.tolist(), ratios.tolist(), pnl.tolist()
+            )
+        ]
+        return actions, confidences, df['close'].to_numpy(dtype=np.float64), reasons
+    
+    def analyze_vectorized(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Generate signal codes for every bar with one state-machine pass
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            int8 array of signal codes (BUY, SELL or HOLD), one per bar
+        """
+        return self._scan(df)[0]
+    
     @staticmethod
     def validate_parameters(parameters: Dict[str, Any]) -> bool:
         """Validate strategy parameters"""
@@ -172,5 +409,7 @@ class OpeningRangeBreakoutStrategy(BaseStrategy):
             raise ValueError("Stop loss percentage must be positive")
         if take_profit_pct <= 0:
             raise ValueError("Take profit percentage must be positive")
+        if parameters.get('volume_average', 'sma') not in ('sma', 'ema'):
+            raise ValueError("Volume average must be 'sma' or 'ema'")
         
         return True
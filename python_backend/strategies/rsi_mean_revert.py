@@ -3,11 +3,12 @@ RSI Mean Reversion Strategy
 Buy when RSI indicates oversold condition (below oversold threshold)
 Sell when RSI indicates overbought condition (above overbought threshold)
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+import numpy as np
 import pandas as pd
 
-from .base import BaseStrategy, Signal
-from indicators.technical import calculate_rsi
+from .base import BaseStrategy, Signal, BUY, SELL, HOLD
+from ._indicator_cache import add_indicators
 
 
 class RSIMeanReversionStrategy(BaseStrategy):
@@ -20,6 +21,12 @@ class RSIMeanReversionStrategy(BaseStrategy):
         self.overbought = self.parameters.get('overbought', 70)
         self.description = f"RSI Mean Reversion (period={self.period}, oversold={self.oversold}, overbought={self.overbought})"
     
+    def required_indicators(self) -> Dict[str, Tuple]:
+        """Indicators read by analyze"""
+        return {
+            f'rsi_{self.period}': ('rsi', self.period),
+        }
+    
     def analyze(self, df: pd.DataFrame, index: int) -> Signal:
         """
         Analyze data and generate signal based on RSI levels
@@ -31,53 +38,121 @@ class RSIMeanReversionStrategy(BaseStrategy):
         Returns:
             Trading signal
         """
+        bars = self.market_arrays(df)
+        timestamp = bars.timestamp[index]
+        close = bars.close[index]
+        
         # Need enough data for RSI calculation
         if index < self.period + 1:
             return Signal(
-                timestamp=df.iloc[index]['timestamp'],
+                timestamp=timestamp,
                 action='hold',
                 confidence=0.0,
                 reason='Insufficient data for RSI calculation',
-                price=df.iloc[index]['close']
+                price=close
             )
         
-        # Calculate RSI
-        close_prices = df['close']
-        rsi = calculate_rsi(close_prices, self.period)
+        # Look up RSI
+        rsi = self.indicator_values(df, f'rsi_{self.period}')
         
-        current_rsi = rsi.iloc[index]
-        previous_rsi = rsi.iloc[index - 1]
+        current_rsi = rsi[index]
+        previous_rsi = rsi[index - 1]
         
         # Check for oversold condition (potential buy)
         if previous_rsi <= self.oversold and current_rsi > self.oversold:
             confidence = (self.oversold - previous_rsi) / self.oversold if previous_rsi < self.oversold else 0.5
             return Signal(
-                timestamp=df.iloc[index]['timestamp'],
+                timestamp=timestamp,
                 action='buy',
                 confidence=min(confidence, 1.0),
                 reason=f'RSI oversold signal: RSI crossed above {self.oversold} (current: {current_rsi:.2f})',
-                price=df.iloc[index]['close']
+                price=close
             )
         
         # Check for overbought condition (potential sell)
         if current_rsi > self.overbought:
             confidence = (current_rsi - self.overbought) / (100 - self.overbought)
             return Signal(
-                timestamp=df.iloc[index]['timestamp'],
+                timestamp=timestamp,
                 action='sell',
                 confidence=min(confidence, 1.0),
                 reason=f'RSI overbought signal: RSI is {current_rsi:.2f} (threshold: {self.overbought})',
-                price=df.iloc[index]['close']
+                price=close
             )
         
         return Signal(
-            timestamp=df.iloc[index]['timestamp'],
+            timestamp=timestamp,
             action='hold',
             confidence=0.0,
-            reason=f'RSI neutral: {current_rsi:.2f}',
-            price=df.iloc[index]['close']
+            reason=f'RSI neutral: {current_rsi:.2f}' if self._describe_holds else '',
+            price=close
         )
     
+    def _scan(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Detect RSI threshold crossings on every bar at once
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            Tuple of (actions, confidences, reason_codes, rsi) with one entry per
+            bar; reason codes are 0 insufficient data, 1 oversold, 2 overbought,
+            3 neutral
+        """
+        df = add_indicators(df, self.required_indicators())
+        rsi = df[f'rsi_{self.period}'].to_numpy(dtype=np.float64)
+        previous_rsi = np.roll(rsi, 1)
+        ready = np.arange(len(df)) >= self.period + 1
+        
+        oversold = ready & (previous_rsi <= self.oversold) & (rsi > self.oversold)
+        overbought = ready & ~oversold & (rsi > self.overbought)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            buy_confidence = np.where(
+                previous_rsi < self.oversold,
+                (self.oversold - previous_rsi) / self.oversold,
+                0.5
+            )
+            sell_confidence = (rsi - self.overbought) / (100 - self.overbought)
+        
+        actions = np.select([oversold, overbought], [BUY, SELL], HOLD).astype(np.int8)
+        confidences = np.minimum(np.select([oversold, overbought], [buy_confidence, sell_confidence], 0.0), 1.0)
+        reason_codes = np.select([~ready, oversold, overbought], [0, 1, 2], 3)
+        return actions, confidences, reason_codes, rsi
+    
+    def analyze_batch(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """
+        Generate full signal details for every bar with array operations
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            Tuple of (actions, confidences, prices, reasons), one entry per bar
+        """
+        actions, confidences, reason_codes, rsi = self._scan(df)
+        templates = (
+            'Insufficient data for RSI calculation',
+            f'RSI oversold signal: RSI crossed above {self.oversold} (current: {{0:.2f}})',
+            f'RSI overbought signal: RSI is {{0:.2f}} (threshold: {self.overbought})',
+            'RSI neutral: {0:.2f}',
+        )
+        reasons = [templates[code].format(value) for code, value in zip(reason_codes.tolist(), rsi.tolist())]
+        return actions, confidences, df['close'].to_numpy(dtype=np.float64), reasons
+    
+    def analyze_vectorized(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Generate signal codes for every bar with array operations
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            int8 array of signal codes (BUY, SELL or HOLD), one per bar
+        """
+        return self._scan(df)[0]
+    
     @staticmethod
     def validate_parameters(parameters: Dict[str, Any]) -> bool:
         """Validate strategy parameters"""
@@ -0,0 +1,61 @@
+"""
+Parallel Strategy Evaluation
+Generates signals for many symbols at once across worker processes
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple, Type
+import numpy as np
+import pandas as pd
+
+from .base import BaseStrategy
+
+SignalArrays = Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]
+
+
+def _run_single(
+    strategy_cls: Type[BaseStrategy],
+    params: Optional[Dict[str, Any]],
+    df: pd.DataFrame
+) -> SignalArrays:
+    """Generate signals for one symbol inside a worker process"""
+    return strategy_cls(params).analyze_batch(df)
+
+
+def run_parallel(
+    strategy_cls: Type[BaseStrategy],
+    params: Optional[Dict[str, Any]],
+    symbol_to_df: Dict[str, pd.DataFrame],
+    max_workers: Optional[int] = None
+) -> Dict[str, SignalArrays]:
+    """
+    Run a strategy over several symbols in parallel, one process per symbol
+
+    Every symbol gets its own strategy instance, so position state never
+    leaks between symbols. A symbol whose evaluation fails is reported and
+    left out of the result.
+
+    Args:
+        strategy_cls: Strategy class to instantiate for each symbol
+        params: Strategy parameters
+        symbol_to_df: OHLCV DataFrame for each symbol
+        max_workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        Mapping of symbol to (actions, confidences, prices, reasons) as
+        returned by analyze_batch, in the order of symbol_to_df
+    """
+    results = {}
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {
+            executor.submit(_run_single, strategy_cls, params, df): symbol
+            for symbol, df in symbol_to_df.items()
+        }
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                results[symbol] = future.result()
+            except Exception as e:
+                print(f"Could not evaluate {strategy_cls.__name__} for {symbol}: {e}")
+
+    return {symbol: results[symbol] for symbol in symbol_to_df if symbol in results}
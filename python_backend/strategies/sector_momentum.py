@@ -4,12 +4,25 @@ Identifies top sectors (via ETFs) each morning
 Picks top 3 stocks in leading sector by volume surge and RSI(14)
 Enters on trend confirmation, exits before close
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import pandas as pd
 import numpy as np
 
-from .base import BaseStrategy, Signal
-from indicators.technical import calculate_rsi, calculate_ema, calculate_sma
+from .base import BaseStrategy, Signal, BUY, SELL
+from ._indicator_cache import add_indicators
+
+
+# Reason templates, indexed by the reason codes of SectorMomentumStrategy._scan
+# and formatted with (sector status, RSI, volume ratio, PnL %)
+_REASONS = (
+    'Insufficient data for calculations',
+    'Sector momentum: RSI={1:.1f}, vol={2:.1f}x, leading sector',
+    'Trailing stop hit: {3:.2f}%',
+    'Trend reversal: {3:.2f}%',
+    'RSI overbought: {1:.1f}, PnL={3:.2f}%',
+    'End of day exit: {3:.2f}%',
+    'Monitoring: {0} sector, RSI={1:.1f}, vol={2:.1f}x',
+)
 
 
 class SectorMomentumStrategy(BaseStrategy):
@@ -21,8 +34,13 @@ class SectorMomentumStrategy(BaseStrategy):
         self.rsi_min = self.parameters.get('rsi_min', 50)  # Bullish momentum threshold
         self.rsi_max = self.parameters.get('rsi_max', 75)  # Not overbought
         self.volume_surge_threshold = self.parameters.get('volume_surge_threshold', 2.0)
+        self.volume_average = self.parameters.get('volume_average', 'sma')  # trailing 'sma' or 'ema' baseline
+        self._avg_volume_kind = 'volume_ema' if self.volume_average == 'ema' else 'volume_mean'
+        self._avg_volume_column = f'{self._avg_volume_kind}_20'
         self.ema_trend_period = self.parameters.get('ema_trend_period', 20)
         self.trailing_stop_pct = self.parameters.get('trailing_stop_pct', 2.5)
+        self._min_required = max(self.rsi_period + 1, self.ema_trend_period)
+        self._trail_mult = 1 - self.trailing_stop_pct / 100
         self.description = f"Sector Momentum (RSI {self.rsi_min}-{self.rsi_max}, vol>{self.volume_surge_threshold}x)"
         
         # Track position state
@@ -31,13 +49,13 @@ class SectorMomentumStrategy(BaseStrategy):
         self.highest_price: Optional[float] = None
         self.sector_selected = False
     
-    def _check_sector_leadership(self, df: pd.DataFrame, index: int) -> bool:
+    def _check_sector_leadership(self, close: np.ndarray, index: int) -> bool:
         """
         Check if stock is in leading sector (simplified version)
         In production, this would query sector ETF performance
         
         Args:
-            df: Price data
+            close: Close prices
             index: Current index
         
         Returns:
@@ -49,9 +67,17 @@ class SectorMomentumStrategy(BaseStrategy):
             return False
         
         # Check recent price momentum
-        recent_return = (df.iloc[index]['close'] - df.iloc[index - 20]['close']) / df.iloc[index - 20]['close']
+        recent_return = (close[index] - close[index - 20]) / close[index - 20]
         return recent_return > 0.03  # 3% gain in recent period
     
+    def required_indicators(self) -> Dict[str, Tuple]:
+        """Indicators read by analyze"""
+        return {
+            f'rsi_{self.rsi_period}': ('rsi', self.rsi_period),
+            f'ema_{self.ema_trend_period}': ('ema', self.ema_trend_period),
+            self._avg_volume_column: (self._avg_volume_kind, 20),
+        }
+    
     def analyze(self, df: pd.DataFrame, index: int) -> Signal:
         """
         Analyze data and generate signal based on sector momentum
@@ -63,34 +89,36 @@ class SectorMomentumStrategy(BaseStrategy):
         Returns:
             Trading signal
         """
+        bars = self.market_arrays(df)
+        timestamp = bars.timestamp[index]
+        close = bars.close[index]
+        
         # Need enough data for calculations
-        if index < max(self.rsi_period + 1, self.ema_trend_period):
+        if index < self._min_required:
             return Signal(
-                timestamp=df.iloc[index]['timestamp'],
+                timestamp=timestamp,
                 action='hold',
                 confidence=0.0,
                 reason='Insufficient data for calculations',
-                price=df.iloc[index]['close']
+                price=close
             )
         
-        bar = df.iloc[index]
-        
-        # Calculate indicators
-        rsi = calculate_rsi(df['close'], self.rsi_period)
-        current_rsi = rsi.iloc[index]
+        # Look up indicators
+        rsi = self.indicator_values(df, f'rsi_{self.rsi_period}')
+        current_rsi = rsi[index]
         
-        ema = calculate_ema(df['close'], self.ema_trend_period)
-        current_ema = ema.iloc[index]
+        ema = self.indicator_values(df, f'ema_{self.ema_trend_period}')
+        current_ema = ema[index]
         
         # Calculate volume surge
-        avg_volume = df['volume'].iloc[max(0, index - 20):index].mean()
-        volume_ratio = bar['volume'] / avg_volume if avg_volume > 0 else 1.0
+        avg_volume = self.indicator_values(df, self._avg_volume_column)[index]
+        volume_ratio = bars.volume[index] / avg_volume if avg_volume > 0 else 1.0
         
         # Check trend
-        is_uptrend = bar['close'] > current_ema
+        is_uptrend = close > current_ema
         
         # Check sector leadership
-        in_leading_sector = self._check_sector_leadership(df, index)
+        in_leading_sector = self._check_sector_leadership(bars.close, index)
         
         # Check if near end of day
         is_closing_period = index >= len(df) - 3
@@ -103,8 +131,8 @@ class SectorMomentumStrategy(BaseStrategy):
                 is_uptrend):
                 
                 self.position_open = True
-                self.entry_price = bar['close']
-                self.highest_price = bar['close']
+                self.entry_price = close
+                self.highest_price = close
                 self.sector_selected = True
                 
                 confidence = min(
@@ -114,49 +142,49 @@ class SectorMomentumStrategy(BaseStrategy):
                 )
                 
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='buy',
                     confidence=confidence,
                     reason=f'Sector momentum: RSI={current_rsi:.1f}, vol={volume_ratio:.1f}x, leading sector',
-                    price=bar['close']
+                    price=close
                 )
         
         # Exit Logic: Trailing stop or end of day
         if self.position_open and self.entry_price is not None:
             # Update highest price for trailing stop
-            if bar['close'] > self.highest_price:
-                self.highest_price = bar['close']
+            if close > self.highest_price:
+                self.highest_price = close
             
-            pnl_pct = ((bar['close'] - self.entry_price) / self.entry_price) * 100
+            pnl_pct = ((close - self.entry_price) / self.entry_price) * 100
             
             # Check trailing stop
-            trailing_stop_price = self.highest_price * (1 - self.trailing_stop_pct / 100)
+            trailing_stop_price = self.highest_price * self._trail_mult
             
-            if bar['close'] <= trailing_stop_price:
+            if close <= trailing_stop_price:
                 self.position_open = False
                 self.entry_price = None
                 self.highest_price = None
                 
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.9,
                     reason=f'Trailing stop hit: {pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
             
             # Trend reversal (close below EMA)
-            if bar['close'] < current_ema:
+            if close < current_ema:
                 self.position_open = False
                 self.entry_price = None
                 self.highest_price = None
                 
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.8,
                     reason=f'Trend reversal: {pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
             
             # RSI overbought exit
@@ -166,11 +194,11 @@ class SectorMomentumStrategy(BaseStrategy):
                 self.highest_price = None
                 
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.8,
                     reason=f'RSI overbought: {current_rsi:.1f}, PnL={pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
             
             # End of day
@@ -180,22 +208,154 @@ class SectorMomentumStrategy(BaseStrategy):
                 self.highest_price = None
                 
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.8,
                     reason=f'End of day exit: {pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
         
         sector_status = "leading" if in_leading_sector else "lagging"
         return Signal(
-            timestamp=bar['timestamp'],
+            timestamp=timestamp,
             action='hold',
             confidence=0.0,
-            reason=f'Monitoring: {sector_status} sector, RSI={current_rsi:.1f}, vol={volume_ratio:.1f}x',
-            price=bar['close']
+            reason=f'Monitoring: {sector_status} sector, RSI={current_rsi:.1f}, vol={volume_ratio:.1f}x' if self._describe_holds else '',
+            price=close
         )
     
+    def _scan(self, df: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+        """
+        Generate signals trade by trade instead of bar by bar
+        
+        Entry and non-trailing exit conditions do not depend on the position,
+        so they are evaluated for every bar at once. The loop then jumps from
+        one entry to its exit, finding the trailing stop with a running
+        maximum of the closes since entry.
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            Tuple of (actions, confidences, reason_codes, leading, rsi,
+            volume_ratio, pnl_pct) with one entry per bar
+        """
+        df = add_indicators(df, self.required_indicators())
+        close = df['close'].to_numpy(dtype=np.float64)
+        volume = df['volume'].to_numpy(dtype=np.float64)
+        avg_volume = df[self._avg_volume_column].to_numpy(dtype=np.float64)
+        rsi = df[f'rsi_{self.rsi_period}'].to_numpy(dtype=np.float64)
+        ema = df[f'ema_{self.ema_trend_period}'].to_numpy(dtype=np.float64)
+        n = len(close)
+        bar = np.arange(n)
+        ready = bar >= self._min_required
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volume_ratio = np.where(avg_volume > 0, volume / avg_volume, 1.0)
+            previous_close = np.roll(close, 20)
+            leading = (bar >= 20) & ((close - previous_close) / previous_close > 0.03)
+            entry_confidence = np.minimum(
+                0.4 + (volume_ratio / (self.volume_surge_threshold * 2)) * 0.3 +
+                ((rsi - self.rsi_min) / (self.rsi_max - self.rsi_min)) * 0.3,
+                1.0
+            )
+        
+        entries = np.flatnonzero(
+            ready & leading &
+            (volume_ratio >= self.volume_surge_threshold) &
+            (self.rsi_min <= rsi) & (rsi <= self.rsi_max) &
+            (close > ema)
+        )
+        
+        # Exits that do not depend on the entry, in analyze's priority order
+        exit_codes = np.select([close < ema, rsi > 80, bar >= n - 3], [3, 4, 5], 0)
+        exit_codes[~ready] = 0
+        exits = np.flatnonzero(exit_codes)
+        
+        actions = np.zeros(n, dtype=np.int8)
+        confidences = np.zeros(n, dtype=np.float64)
+        reason_codes = np.where(ready, 6, 0).astype(np.int8)
+        pnl = np.zeros(n, dtype=np.float64)
+        
+        position_open = self.position_open and self.entry_price is not None
+        entry_price = self.entry_price
+        highest_price = self.highest_price
+        i = self._min_required
+        while i < n:
+            if not position_open:
+                k = np.searchsorted(entries, i)
+                if k == len(entries):
+                    break
+                i = entries[k]
+                actions[i] = BUY
+                confidences[i] = entry_confidence[i]
+                reason_codes[i] = 1
+                position_open = True
+                entry_price = highest_price = close[i]
+                self.sector_selected = True
+                i += 1
+                continue
+            
+            # Trailing stop is only searched up to the next fixed exit
+            k = np.searchsorted(exits, i)
+            last = exits[k] if k < len(exits) else n - 1
+            window = close[i:last + 1]
+            running_high = np.fmax.accumulate(np.concatenate(([highest_price], window)))[1:]
+            stops = np.flatnonzero(window <= running_high * self._trail_mult)
+            if len(stops):
+                i += stops[0]
+                reason_codes[i] = 2
+                confidences[i] = 0.9
+            elif k < len(exits):
+                i = last
+                reason_codes[i] = exit_codes[i]
+                confidences[i] = 0.8
+            else:
+                highest_price = running_high[-1]
+                break
+            
+            actions[i] = SELL
+            pnl[i] = ((close[i] - entry_price) / entry_price) * 100
+            position_open = False
+            entry_price = highest_price = None
+            i += 1
+        
+        self.position_open = position_open
+        self.entry_price = entry_price if position_open else None
+        self.highest_price = highest_price if position_open else None
+        return actions, confidences, reason_codes, leading, rsi, volume_ratio, pnl
+    
+    def analyze_batch(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """
+        Generate full signal details for every bar, jumping from trade to trade
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            Tuple of (actions, confidences, prices, reasons), one entry per bar
+        """
+        actions, confidences, reason_codes, leading, rsi, volume_ratio, pnl = self._scan(df)
+        reasons = [
+            _REASONS[code].format('leading' if lead else 'lagging', value, ratio, pnl_pct)
+            for code, lead, value, ratio, pnl_pct in zip(
+                reason_codes.tolist(), leading.tolist(), rsi.tolist(), volume_ratio.tolist(), pnl.tolist()
+            )
+        ]
+        return actions, confidences, df['close'].to_numpy(dtype=np.float64), reasons
+    
+    def analyze_vectorized(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Generate signal codes for every bar, jumping from trade to trade
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            int8 array of signal codes (BUY, SELL or HOLD), one per bar
+        """
+        return self._scan(df)[0]
+    
     @staticmethod
     def validate_parameters(parameters: Dict[str, Any]) -> bool:
         """Validate strategy parameters"""
@@ -214,5 +374,7 @@ class SectorMomentumStrategy(BaseStrategy):
             raise ValueError("RSI min must be less than RSI max")
         if volume_surge_threshold <= 0:
             raise ValueError("Volume surge threshold must be positive")
+        if parameters.get('volume_average', 'sma') not in ('sma', 'ema'):
+            raise ValueError("Volume average must be 'sma' or 'ema'")
         
         return True
@@ -3,12 +3,12 @@ SMA Crossover Strategy
 Buy when short-period SMA crosses above long-period SMA
 Sell when short-period SMA crosses below long-period SMA
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+import numpy as np
 import pandas as pd
-from datetime import datetime
 
-from .base import BaseStrategy, Signal
-from indicators.technical import calculate_sma
+from .base import BaseStrategy, Signal, BUY, SELL, HOLD
+from ._indicator_cache import add_indicators
 
 
 class SMACrossoverStrategy(BaseStrategy):
@@ -20,6 +20,13 @@ class SMACrossoverStrategy(BaseStrategy):
         self.long_period = self.parameters.get('long_period', 30)
         self.description = f"SMA Crossover ({self.short_period}/{self.long_period})"
     
+    def required_indicators(self) -> Dict[str, Tuple]:
+        """Indicators read by analyze"""
+        return {
+            f'sma_{self.short_period}': ('sma', self.short_period),
+            f'sma_{self.long_period}': ('sma', self.long_period),
+        }
+    
     def analyze(self, df: pd.DataFrame, index: int) -> Signal:
         """
         Analyze data and generate signal based on SMA crossover
@@ -31,57 +38,122 @@ class SMACrossoverStrategy(BaseStrategy):
         Returns:
             Trading signal
         """
+        bars = self.market_arrays(df)
+        timestamp = bars.timestamp[index]
+        close = bars.close[index]
+        
         # Need enough data for both SMAs
         if index < self.long_period:
             return Signal(
-                timestamp=df.iloc[index]['timestamp'],
+                timestamp=timestamp,
                 action='hold',
                 confidence=0.0,
                 reason='Insufficient data for analysis',
-                price=df.iloc[index]['close']
+                price=close
             )
         
-        # Calculate SMAs
-        close_prices = df['close']
-        short_sma = calculate_sma(close_prices, self.short_period)
-        long_sma = calculate_sma(close_prices, self.long_period)
+        # Look up SMAs
+        short_sma = self.indicator_values(df, f'sma_{self.short_period}')
+        long_sma = self.indicator_values(df, f'sma_{self.long_period}')
         
-        current_short = short_sma.iloc[index]
-        current_long = long_sma.iloc[index]
-        previous_short = short_sma.iloc[index - 1]
-        previous_long = long_sma.iloc[index - 1]
+        current_short = short_sma[index]
+        current_long = long_sma[index]
+        previous_short = short_sma[index - 1]
+        previous_long = long_sma[index - 1]
         
         # Check for crossover
         # Bullish crossover: short crosses above long
         if previous_short <= previous_long and current_short > current_long:
             confidence = min(abs(current_short - current_long) / current_long, 1.0)
             return Signal(
-                timestamp=df.iloc[index]['timestamp'],
+                timestamp=timestamp,
                 action='buy',
                 confidence=confidence,
                 reason=f'SMA bullish crossover: {self.short_period}-period crossed above {self.long_period}-period',
-                price=df.iloc[index]['close']
+                price=close
             )
         
         # Bearish crossover: short crosses below long
         if previous_short >= previous_long and current_short < current_long:
             confidence = min(abs(current_long - current_short) / current_long, 1.0)
             return Signal(
-                timestamp=df.iloc[index]['timestamp'],
+                timestamp=timestamp,
                 action='sell',
                 confidence=confidence,
                 reason=f'SMA bearish crossover: {self.short_period}-period crossed below {self.long_period}-period',
-                price=df.iloc[index]['close']
+                price=close
             )
         
         return Signal(
-            timestamp=df.iloc[index]['timestamp'],
+            timestamp=timestamp,
             action='hold',
             confidence=0.0,
             reason='No crossover detected',
-            price=df.iloc[index]['close']
+            price=close
         )
     
+    def _scan(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Detect crossovers on every bar at once
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            Tuple of (actions, confidences, reason_codes) with one entry per bar;
+            reason codes are 0 insufficient data, 1 bullish, 2 bearish, 3 none
+        """
+        df = add_indicators(df, self.required_indicators())
+        short_sma = df[f'sma_{self.short_period}'].to_numpy(dtype=np.float64)
+        long_sma = df[f'sma_{self.long_period}'].to_numpy(dtype=np.float64)
+        
+        previous_short = np.roll(short_sma, 1)
+        previous_long = np.roll(long_sma, 1)
+        ready = np.arange(len(df)) >= max(self.long_period, 1)
+        
+        bullish = ready & (previous_short <= previous_long) & (short_sma > long_sma)
+        bearish = ready & ~bullish & (previous_short >= previous_long) & (short_sma < long_sma)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            confidence = np.minimum(np.abs(short_sma - long_sma) / long_sma, 1.0)
+        
+        actions = np.select([bullish, bearish], [BUY, SELL], HOLD).astype(np.int8)
+        confidences = np.where(bullish | bearish, confidence, 0.0)
+        reason_codes = np.select([~ready, bullish, bearish], [0, 1, 2], 3)
+        return actions, confidences, reason_codes
+    
+    def analyze_batch(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """
+        Generate full signal details for every bar with array operations
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            Tuple of (actions, confidences, prices, reasons), one entry per bar
+        """
+        actions, confidences, reason_codes = self._scan(df)
+        templates = (
+            'Insufficient data for analysis',
+            f'SMA bullish crossover: {self.short_period}-period crossed above {self.long_period}-period',
+            f'SMA bearish crossover: {self.short_period}-period crossed below {self.long_period}-period',
+            'No crossover detected',
+        )
+        reasons = [templates[code] for code in reason_codes.tolist()]
+        return actions, confidences, df['close'].to_numpy(dtype=np.float64), reasons
+    
+    def analyze_vectorized(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Generate signal codes for every bar with array operations
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            int8 array of signal codes (BUY, SELL or HOLD), one per bar
+        """
+        return self._scan(df)[0]
+    
     @staticmethod
     def validate_parameters(parameters: Dict[str, Any]) -> bool:
         """Validate strategy parameters"""
@@ -1,15 +1,113 @@
 """
 VWAP Mean Reversion Strategy
-Buy dips below VWAP in uptrend (EMA20 > EMA50)
-Sell rallies above VWAP in downtrend
-Exit on mean reversion or before close
+Buy dips below VWAP in uptrend (EMA20 > EMA50); long only
+Exit on mean reversion, stop-loss, take-profit or before close
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 
-from .base import BaseStrategy, Signal
-from indicators.technical import calculate_vwap, calculate_ema
+from .base import BaseStrategy, Signal, BUY, SELL
+from ._indicator_cache import add_indicators
+from indicators._njit import njit
+
+
+# Reason templates, indexed by the reason codes of _vwap_reversion_scan and
+# formatted with (VWAP deviation %, PnL %)
+_REASONS = (
+    'Insufficient data for calculations',
+    'VWAP dip in uptrend: {0:.2f}% below VWAP',
+    'Mean reversion to VWAP: {1:.2f}%',
+    'Stop-loss hit: {1:.2f}%',
+    'Take-profit hit: {1:.2f}%',
+    'End of day exit: {1:.2f}%',
+    'Monitoring: uptrend, VWAP dev={0:.2f}%',
+    'Monitoring: downtrend, VWAP dev={0:.2f}%',
+    'Monitoring: neutral, VWAP dev={0:.2f}%',
+)
+
+
+@njit(cache=True, error_model='numpy')
+def _vwap_reversion_scan(
+    close, vwap, ema_fast, ema_slow, closing, min_required,
+    vwap_deviation_pct, tp_mult, sl_mult,
+    position_open, entry_price
+):
+    """
+    Run the entry/exit state machine over whole series in one pass
+    
+    The deviation from VWAP is computed in the same loop rather than as a
+    separate array pass.
+    
+    Args:
+        close: Close prices
+        vwap: VWAP values
+        ema_fast: Fast EMA values
+        ema_slow: Slow EMA values
+        closing: Whether each bar is among the last bars of its day
+        min_required: Bars needed before the first signal
+        vwap_deviation_pct: Deviation below VWAP needed to enter
+        tp_mult: Take-profit price as a multiple of the entry price
+        sl_mult: Stop-loss price as a multiple of the entry price
+        position_open: Whether a position is open before the first bar
+        entry_price: Entry price of that position
+    
+    Returns:
+        Tuple of (actions, confidences, reason_codes, deviation_pct, pnl_pct,
+        position_open, entry_price) with one array entry per bar and the final
+        position state
+    """
+    n = close.shape[0]
+    actions = np.zeros(n, dtype=np.int8)
+    confidences = np.zeros(n, dtype=np.float64)
+    reason_codes = np.zeros(n, dtype=np.int8)
+    deviation = np.zeros(n, dtype=np.float64)
+    pnl = np.zeros(n, dtype=np.float64)
+    
+    for i in range(min(min_required, n), n):
+        price = close[i]
+        deviation[i] = ((price - vwap[i]) / vwap[i]) * 100
+        is_uptrend = ema_fast[i] > ema_slow[i]
+        if is_uptrend:
+            reason_codes[i] = 6
+        elif ema_fast[i] < ema_slow[i]:
+            reason_codes[i] = 7
+        else:
+            reason_codes[i] = 8
+        
+        # Entry Logic: Buy dips below VWAP in an uptrend
+        if not position_open:
+            if is_uptrend and deviation[i] < -vwap_deviation_pct:
+                position_open = True
+                entry_price = price
+                actions[i] = BUY
+                confidences[i] = min(0.5 + (abs(deviation[i]) / (vwap_deviation_pct * 2)) * 0.5, 1.0)
+                reason_codes[i] = 1
+            continue
+        
+        # Exit Logic: Mean reversion, stop-loss, take-profit, or end of day
+        pnl[i] = ((price - entry_price) / entry_price) * 100
+        if price >= vwap[i]:
+            code = 2
+            confidence = 0.8
+        elif price <= entry_price * sl_mult:
+            code = 3
+            confidence = 0.9
+        elif price >= entry_price * tp_mult:
+            code = 4
+            confidence = 0.9
+        elif closing[i]:
+            code = 5
+            confidence = 0.8
+        else:
+            continue
+        
+        position_open = False
+        actions[i] = SELL
+        confidences[i] = confidence
+        reason_codes[i] = code
+    
+    return actions, confidences, reason_codes, deviation, pnl, position_open, entry_price
 
 
 class VWAPReversionStrategy(BaseStrategy):
@@ -22,12 +120,24 @@ class VWAPReversionStrategy(BaseStrategy):
         self.vwap_deviation_pct = self.parameters.get('vwap_deviation_pct', 0.5)  # % below VWAP to buy
         self.take_profit_pct = self.parameters.get('take_profit_pct', 1.0)
         self.stop_loss_pct = self.parameters.get('stop_loss_pct', 1.5)
+        self._min_required = self.ema_slow + 1
+        self._tp_mult = 1 + self.take_profit_pct / 100
+        self._sl_mult = 1 - self.stop_loss_pct / 100
         self.description = f"VWAP Mean Reversion (EMA{self.ema_fast}/{self.ema_slow})"
         
         # Track position state
         self.position_open = False
         self.entry_price: Optional[float] = None
     
+    def required_indicators(self) -> Dict[str, Tuple]:
+        """Indicators read by analyze"""
+        return {
+            'session_vwap': ('session_vwap',),
+            f'ema_{self.ema_fast}': ('ema', self.ema_fast),
+            f'ema_{self.ema_slow}': ('ema', self.ema_slow),
+            'session_end_3': ('session_end', 3),
+        }
+    
     def analyze(self, df: pd.DataFrame, index: int) -> Signal:
         """
         Analyze data and generate signal based on VWAP mean reversion
@@ -39,46 +149,46 @@ class VWAPReversionStrategy(BaseStrategy):
         Returns:
             Trading signal
         """
+        bars = self.market_arrays(df)
+        timestamp = bars.timestamp[index]
+        close = bars.close[index]
+        
         # Need enough data for calculations
-        if index < self.ema_slow + 1:
+        if index < self._min_required:
             return Signal(
-                timestamp=df.iloc[index]['timestamp'],
+                timestamp=timestamp,
                 action='hold',
                 confidence=0.0,
                 reason='Insufficient data for calculations',
-                price=df.iloc[index]['close']
+                price=close
             )
         
-        bar = df.iloc[index]
+        # Look up VWAP, which restarts at each day's first bar
+        vwap = self.indicator_values(df, 'session_vwap')
+        current_vwap = vwap[index]
         
-        # Calculate VWAP
-        # For intraday, VWAP should reset each day, but we'll calculate cumulatively here
-        vwap = calculate_vwap(df.iloc[:index + 1])
-        current_vwap = vwap.iloc[-1]
+        # Look up EMAs to determine trend
+        ema_fast = self.indicator_values(df, f'ema_{self.ema_fast}')
+        ema_slow = self.indicator_values(df, f'ema_{self.ema_slow}')
         
-        # Calculate EMAs to determine trend
-        ema_fast = calculate_ema(df['close'], self.ema_fast)
-        ema_slow = calculate_ema(df['close'], self.ema_slow)
-        
-        current_ema_fast = ema_fast.iloc[index]
-        current_ema_slow = ema_slow.iloc[index]
+        current_ema_fast = ema_fast[index]
+        current_ema_slow = ema_slow[index]
         
         # Determine trend
         is_uptrend = current_ema_fast > current_ema_slow
-        is_downtrend = current_ema_fast < current_ema_slow
         
         # Calculate deviation from VWAP
-        vwap_deviation_pct = ((bar['close'] - current_vwap) / current_vwap) * 100
+        vwap_deviation_pct = ((close - current_vwap) / current_vwap) * 100
         
         # Check if near end of day
-        is_closing_period = index >= len(df) - 3
+        is_closing_period = self.indicator_values(df, 'session_end_3')[index]
         
-        # Entry Logic: Buy dips in uptrend, sell rallies in downtrend
+        # Entry Logic: Buy dips in uptrend
         if not self.position_open:
             # Long entry: Price below VWAP in uptrend
             if is_uptrend and vwap_deviation_pct < -self.vwap_deviation_pct:
                 self.position_open = True
-                self.entry_price = bar['close']
+                self.entry_price = close
                 
                 confidence = min(
                     0.5 + (abs(vwap_deviation_pct) / (self.vwap_deviation_pct * 2)) * 0.5,
@@ -86,53 +196,53 @@ class VWAPReversionStrategy(BaseStrategy):
                 )
                 
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='buy',
                     confidence=confidence,
                     reason=f'VWAP dip in uptrend: {vwap_deviation_pct:.2f}% below VWAP',
-                    price=bar['close']
+                    price=close
                 )
         
         # Exit Logic: Mean reversion, stop-loss, take-profit, or end of day
         if self.position_open and self.entry_price is not None:
-            pnl_pct = ((bar['close'] - self.entry_price) / self.entry_price) * 100
+            pnl_pct = ((close - self.entry_price) / self.entry_price) * 100
             
             # Mean reversion: price back to or above VWAP
-            if bar['close'] >= current_vwap:
+            if close >= current_vwap:
                 self.position_open = False
                 self.entry_price = None
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.8,
                     reason=f'Mean reversion to VWAP: {pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
             
             # Stop-loss
-            stop_loss_price = self.entry_price * (1 - self.stop_loss_pct / 100)
-            if bar['close'] <= stop_loss_price:
+            stop_loss_price = self.entry_price * self._sl_mult
+            if close <= stop_loss_price:
                 self.position_open = False
                 self.entry_price = None
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.9,
                     reason=f'Stop-loss hit: {pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
             
             # Take-profit
-            take_profit_price = self.entry_price * (1 + self.take_profit_pct / 100)
-            if bar['close'] >= take_profit_price:
+            take_profit_price = self.entry_price * self._tp_mult
+            if close >= take_profit_price:
                 self.position_open = False
                 self.entry_price = None
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.9,
                     reason=f'Take-profit hit: {pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
             
             # End of day
@@ -140,21 +250,73 @@ class VWAPReversionStrategy(BaseStrategy):
                 self.position_open = False
                 self.entry_price = None
                 return Signal(
-                    timestamp=bar['timestamp'],
+                    timestamp=timestamp,
                     action='sell',
                     confidence=0.8,
                     reason=f'End of day exit: {pnl_pct:.2f}%',
-                    price=bar['close']
+                    price=close
                 )
         
-        trend_str = "uptrend" if is_uptrend else "downtrend" if is_downtrend else "neutral"
+        reason = ''
+        if self._describe_holds:
+            trend_str = "uptrend" if is_uptrend else "downtrend" if current_ema_fast < current_ema_slow else "neutral"
+            reason = f'Monitoring: {trend_str}, VWAP dev={vwap_deviation_pct:.2f}%'
         return Signal(
-            timestamp=bar['timestamp'],
+            timestamp=timestamp,
             action='hold',
             confidence=0.0,
-            reason=f'Monitoring: {trend_str}, VWAP dev={vwap_deviation_pct:.2f}%',
-            price=bar['close']
+            reason=reason,
+            price=close
+        )
+    
+    def _scan(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Run the state machine over the whole DataFrame, carrying the position state"""
+        df = add_indicators(df, self.required_indicators())
+        actions, confidences, reason_codes, deviation, pnl, position_open, entry_price = _vwap_reversion_scan(
+            df['close'].to_numpy(dtype=np.float64),
+            df['session_vwap'].to_numpy(dtype=np.float64),
+            df[f'ema_{self.ema_fast}'].to_numpy(dtype=np.float64),
+            df[f'ema_{self.ema_slow}'].to_numpy(dtype=np.float64),
+            df['session_end_3'].to_numpy(dtype=np.bool_),
+            self._min_required,
+            float(self.vwap_deviation_pct),
+            float(self._tp_mult),
+            float(self._sl_mult),
+            self.position_open and self.entry_price is not None,
+            float(self.entry_price or 0.0)
         )
+        self.position_open = position_open
+        self.entry_price = entry_price if position_open else None
+        return actions, confidences, reason_codes, deviation, pnl
+    
+    def analyze_batch(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """
+        Generate full signal details for every bar with one state-machine pass
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            Tuple of (actions, confidences, prices, reasons), one entry per bar
+        """
+        actions, confidences, reason_codes, deviation, pnl = self._scan(df)
+        reasons = [
+            _REASONS[code].format(dev, pnl_pct)
+            for code, dev, pnl_pct in zip(reason_codes.tolist(), deviation.tolist(), pnl.tolist())
+        ]
+        return actions, confidences, df['close'].to_numpy(dtype=np.float64), reasons
+    
+    def analyze_vectorized(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Generate signal codes for every bar with one state-machine pass
+        
+        Args:
+            df: DataFrame with OHLCV data
+        
+        Returns:
+            int8 array of signal codes (BUY, SELL or HOLD), one per bar
+        """
+        return self._scan(df)[0]
     
     @staticmethod
     def validate_parameters(parameters: Dict[str, Any]) -> bool: